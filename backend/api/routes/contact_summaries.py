@@ -367,7 +367,7 @@ async def invalidate_contact_summary_cache(
         success = await service.update_summary_on_interaction(
             contact_id=contact_id,
             user_id=current_user.id,
-            interaction_data={"type": "manual_cache_invalidation"}
+            interaction_data={"type": ContactSummarizationService.MANUAL_INVALIDATION}
         )
         
         if success:
@@ -215,7 +215,7 @@ async def build_conversation_threads(
         )
         
         # Find merge candidates for manual review
-        merge_candidates = await service._find_thread_merge_candidates(threads)
+        merge_candidates = service._find_thread_merge_candidates(threads)
         manual_review_candidates = [
             candidate for candidate in merge_candidates
             if candidate.recommended_action == 'manual_review'
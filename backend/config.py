@@ -50,6 +50,7 @@ class Settings(BaseSettings):
     OPENAI_MAX_RETRIES: int = Field(3, env="OPENAI_MAX_RETRIES")
     OPENAI_TIMEOUT: int = Field(60, env="OPENAI_TIMEOUT")
     OPENAI_RATE_LIMIT_RPM: int = Field(60, env="OPENAI_RATE_LIMIT_RPM")
+    THREAD_SUMMARY_CONCURRENCY: int = Field(8, env="THREAD_SUMMARY_CONCURRENCY")
     
     # LangSmith
     LANGCHAIN_TRACING_V2: bool = True
@@ -0,0 +1,71 @@
+"""Shared caching helpers: an in-process TTL LRU and a process-wide Redis client."""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, Optional, Tuple
+
+import redis
+
+from config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis_client() -> redis.Redis:
+    """Process-wide Redis client, pinged once on first use.
+
+    Failures are not cached, so a later call retries the connection.
+    """
+    client = redis.Redis.from_url(settings.REDIS_URL)
+    client.ping()
+    return client
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache with a per-entry TTL.
+
+    Used in front of Redis so hot entries are served without a round-trip or
+    decode. Entries are returned as stored, so callers that hand them out
+    must not mutate them.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get an unexpired entry and mark it as recently used."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """Store an entry, evicting the least recently used ones beyond maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        """Remove entries if present."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
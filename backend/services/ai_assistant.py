@@ -28,6 +28,12 @@ from lib.logger import logger
 from lib.llm_client import get_openai_client, LLMUsageType, OpenAIModel, LLMResponse
 from lib.exceptions import AIRException
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class AIAssistantError(AIRException):
     """AI Assistant specific errors"""
@@ -134,9 +140,14 @@ class AIAssistantService:
             **kwargs
         }
         
-        # Generate hash of content
-        content_str = json.dumps(cache_content, sort_keys=True)
-        content_hash = hashlib.md5(content_str.encode()).hexdigest()[:16]
+        # Generate hash of content; both encoders emit the same compact, key-sorted bytes
+        if ORJSON_AVAILABLE:
+            content_bytes = orjson.dumps(cache_content, option=orjson.OPT_SORT_KEYS)
+        else:
+            content_bytes = json.dumps(
+                cache_content, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            ).encode()
+        content_hash = hashlib.md5(content_bytes).hexdigest()[:16]
         
         # Generate cache key
         cache_key = f"{self.cache_prefix}:{request_type}:{user_id}:{content_hash}"
@@ -158,7 +169,7 @@ class AIAssistantService:
         try:
             cached_data = self.redis_client.get(cache_key)
             if cached_data:
-                return json.loads(cached_data)
+                return orjson.loads(cached_data) if ORJSON_AVAILABLE else json.loads(cached_data)
             return None
         except Exception as e:
             logger.warning(f"Failed to get cached response: {e}")
@@ -186,7 +197,7 @@ class AIAssistantService:
         
         try:
             ttl = ttl or self.default_ttl
-            cached_data = json.dumps(response_data)
+            cached_data = orjson.dumps(response_data) if ORJSON_AVAILABLE else json.dumps(response_data)
             self.redis_client.setex(cache_key, ttl, cached_data)
             return True
         except Exception as e:
@@ -19,6 +19,7 @@ from models.orm.interaction import Interaction
 from models.orm.interest import Interest
 from models.orm.user import User
 from services.contact_deduplication import DuplicateMatch, ContactDeduplicationService
+from services.conversation_threading_service import ConversationThreadingService
 
 logger = logging.getLogger(__name__)
 
@@ -540,6 +541,12 @@ class ContactMergingService:
             
             logger.info(f"Successfully merged contact {secondary_contact.id} into {primary_contact.id}")
             
+            # The moved interactions join the primary contact's threads, so rebuild their summaries
+            if interactions_merged:
+                await ConversationThreadingService.schedule_summary_refresh_async(
+                    str(primary_contact.user_id), str(primary_contact.id)
+                )
+            
             return MergeResult(
                 success=True,
                 merged_contact_id=str(primary_contact.id),
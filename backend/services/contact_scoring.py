@@ -8,41 +8,78 @@ meeting patterns, response reliability, and more.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from pydantic import BaseModel, Field, validator
-import statistics
-import re
-from collections import defaultdict, Counter
+from datetime import datetime, timezone
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from dataclasses import asdict, dataclass, fields
+import math
+from bisect import bisect_right
+from operator import mul
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-class ScoringWeights(BaseModel):
+def _mean(values: List[float]) -> float:
+    """Arithmetic mean without the overhead of statistics.mean"""
+    return sum(values) / len(values)
+
+
+def _stdev(values: List[float]) -> float:
+    """Sample standard deviation computed in a single Welford pass"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    return math.sqrt(m2 / (count - 1))
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringWeights:
     """Configurable weights for different scoring components"""
     
-    frequency_weight: float = Field(0.25, ge=0.0, le=1.0, description="Weight for interaction frequency")
-    recency_weight: float = Field(0.15, ge=0.0, le=1.0, description="Weight for interaction recency")
-    meeting_consistency_weight: float = Field(0.15, ge=0.0, le=1.0, description="Weight for meeting consistency")
-    response_reliability_weight: float = Field(0.15, ge=0.0, le=1.0, description="Weight for response reliability")
-    communication_quality_weight: float = Field(0.10, ge=0.0, le=1.0, description="Weight for communication quality")
-    sentiment_weight: float = Field(0.10, ge=0.0, le=1.0, description="Weight for sentiment analysis")
-    professional_context_weight: float = Field(0.05, ge=0.0, le=1.0, description="Weight for professional context")
-    relationship_trajectory_weight: float = Field(0.05, ge=0.0, le=1.0, description="Weight for relationship trajectory")
-    
-    @validator('*', pre=True)
-    def validate_weights_sum(cls, v, values):
-        """Ensure all weights sum to 1.0"""
-        if len(values) == 7:  # All weights have been set
-            total = sum(values.values()) + v
-            if abs(total - 1.0) > 0.001:
-                raise ValueError(f"All weights must sum to 1.0, got {total}")
-        return v
+    frequency_weight: float = 0.25  # Weight for interaction frequency
+    recency_weight: float = 0.15  # Weight for interaction recency
+    meeting_consistency_weight: float = 0.15  # Weight for meeting consistency
+    response_reliability_weight: float = 0.15  # Weight for response reliability
+    communication_quality_weight: float = 0.10  # Weight for communication quality
+    sentiment_weight: float = 0.10  # Weight for sentiment analysis
+    professional_context_weight: float = 0.05  # Weight for professional context
+    relationship_trajectory_weight: float = 0.05  # Weight for relationship trajectory
+    
+    def __post_init__(self):
+        """Ensure each weight is within [0, 1] and all weights sum to 1.0"""
+        weights = self.as_vector()
+        for weight_field, value in zip(fields(self), weights):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{weight_field.name} must be between 0.0 and 1.0, got {value}")
+        
+        total = sum(weights)
+        if abs(total - 1.0) > 0.001:
+            raise ValueError(f"All weights must sum to 1.0, got {total}")
+    
+    def model_dump(self) -> Dict[str, float]:
+        """Return the weights as a dict (kept for compatibility with the former Pydantic model)"""
+        return asdict(self)
+    
+    def as_vector(self) -> Tuple[float, ...]:
+        """Weights in the canonical component order used for the overall score"""
+        return (
+            self.frequency_weight,
+            self.recency_weight,
+            self.meeting_consistency_weight,
+            self.response_reliability_weight,
+            self.communication_quality_weight,
+            self.sentiment_weight,
+            self.professional_context_weight,
+            self.relationship_trajectory_weight
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContactMetrics:
     """Metrics calculated for a contact"""
     total_interactions: int
@@ -64,11 +101,110 @@ class ContactMetrics:
     contact_initiated_ratio: float
 
 
+class InteractionRecord(NamedTuple):
+    """Interaction fields consumed by the date-based metrics, read once per interaction"""
+    interaction_type: Optional[str]
+    direction: Optional[str]
+    interaction_date: datetime
+
+
 class ContactScoringService:
     """Service for scoring contact relationship quality"""
     
+    # Content keywords indicating a detailed, substantive exchange
+    DEPTH_KEYWORDS = ("project", "meeting", "discussion", "proposal", "plan", "strategy")
+    
+    # Sentiment keywords
+    POSITIVE_KEYWORDS = (
+        "thanks", "great", "excellent", "wonderful", "appreciate", "love",
+        "fantastic", "amazing", "perfect", "brilliant", "outstanding"
+    )
+    NEGATIVE_KEYWORDS = (
+        "sorry", "unfortunately", "problem", "issue", "concern", "worried",
+        "disappointed", "frustrated", "difficult", "challenging"
+    )
+    SENTIMENT_KEYWORDS = POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS
+    POSITIVE_KEYWORD_SET = frozenset(POSITIVE_KEYWORDS)
+    
+    # Content indicators of an engaged reply
+    ENGAGEMENT_INDICATORS = ("question", "?", "thoughts", "opinion")
+    
+    # Sort key for interactions without a date
+    MIN_INTERACTION_DATE = datetime.min.replace(tzinfo=timezone.utc)
+    
+    # Baseline engagement quality per interaction type
+    TYPE_QUALITY = {
+        "meeting": 1.0,
+        "call": 0.8,
+        "email": 0.6,
+        "message": 0.4
+    }
+    
+    # Insight rules in priority order: (predicate(metrics, component_scores), message template)
+    INSIGHT_RULES = (
+        (lambda m, c: c["frequency"] > 0.8, "Very active relationship with frequent interactions"),
+        (lambda m, c: c["frequency"] < 0.3, "Low interaction frequency - relationship may need more attention"),
+        (lambda m, c: m.days_since_last_interaction > 60,
+         "No recent contact for {metrics.days_since_last_interaction} days - consider reaching out"),
+        (lambda m, c: m.days_since_last_interaction < 7, "Recent active communication indicates strong engagement"),
+        (lambda m, c: m.response_rate > 0.8, "Highly responsive contact - reliable for important communications"),
+        (lambda m, c: m.response_rate < 0.3, "Low response rate - may prefer alternative communication methods"),
+        (lambda m, c: m.professional_relevance_score > 0.7, "Strong professional relationship with business relevance"),
+        (lambda m, c: m.sentiment_score > 0.7, "Positive communication tone indicates good relationship health"),
+        (lambda m, c: m.sentiment_score < 0.4, "Communication tone suggests potential relationship challenges"),
+        (lambda m, c: m.relationship_growth_rate > 0.7, "Relationship is strengthening over time"),
+        (lambda m, c: m.relationship_growth_rate < 0.3, "Relationship activity has declined - may need re-engagement")
+    )
+    MAX_INSIGHTS = 5
+    
+    # Tier-specific recommendations, listed before the metric-based ones
+    TIER_RECOMMENDATIONS = {
+        "dormant": (
+            "Schedule a catch-up call or send a re-engagement email",
+            "Share relevant industry news or insights to restart conversation"
+        ),
+        "peripheral": (
+            "Increase interaction frequency with regular check-ins",
+            "Invite to relevant events or meetings"
+        ),
+        "active_network": (
+            "Maintain current engagement level with periodic updates",
+            "Look for collaboration opportunities"
+        ),
+        "strong_network": (
+            "Leverage this relationship for strategic initiatives",
+            "Consider introducing them to other valuable contacts"
+        ),
+        "inner_circle": (
+            "Continue nurturing this key relationship",
+            "Seek their input on important decisions"
+        )
+    }
+    
+    # Metric-based recommendation rules, applied after the tier recommendations
+    RECOMMENDATION_RULES = (
+        (lambda m, c: m.response_rate < 0.5, "Try different communication channels (phone vs email)"),
+        (lambda m, c: m.meeting_count == 0 and m.total_interactions > 5,
+         "Suggest a face-to-face or video meeting to deepen the relationship"),
+        (lambda m, c: c["sentiment"] < 0.5, "Address any potential concerns or misunderstandings"),
+        (lambda m, c: m.days_since_last_interaction > 30, "Send a personalized message to re-establish contact")
+    )
+    MAX_RECOMMENDATIONS = 4
+    
+    # Score interpretations in ascending order, split at SCORE_INTERPRETATION_BOUNDS
+    SCORE_INTERPRETATION_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+    SCORE_INTERPRETATIONS = (
+        "Inactive relationship ({tier}). No recent meaningful interaction - may need significant re-engagement effort.",
+        "Limited relationship quality ({tier}). Minimal interaction - consider re-engagement strategies.",
+        "Moderate relationship quality ({tier}). Some engagement but room for improvement.",
+        "Good relationship quality ({tier}). Regular interaction with positive engagement patterns.",
+        "Excellent relationship quality ({tier}). This is a key professional contact with strong, consistent engagement."
+    )
+    
     def __init__(self):
         self.default_weights = ScoringWeights()
+        self._default_weight_vector = self.default_weights.as_vector()
+        self._default_weights_dump = self.default_weights.model_dump()
         self.tier_thresholds = {
             "inner_circle": 0.8,
             "strong_network": 0.6,
@@ -76,6 +212,10 @@ class ContactScoringService:
             "peripheral": 0.2,
             "dormant": 0.0
         }
+        # Ascending lower bounds and tier names for bisect-based tier lookup
+        ascending_tiers = sorted(self.tier_thresholds.items(), key=lambda item: item[1])
+        self._tier_bounds = [threshold for _, threshold in ascending_tiers[1:]]
+        self._tier_names = [tier for tier, _ in ascending_tiers]
         self.tier_descriptions = {
             "inner_circle": "Your closest professional relationships with frequent, high-quality interactions",
             "strong_network": "Important contacts with regular communication and strong professional ties",
@@ -86,7 +226,8 @@ class ContactScoringService:
     
     def get_default_weights(self) -> Dict[str, float]:
         """Get default scoring weights"""
-        return self.default_weights.model_dump()
+        # The service is shared across requests, so callers get their own copy of the cached dump
+        return dict(self._default_weights_dump)
     
     def get_contact_tiers(self) -> Dict[str, str]:
         """Get contact tier descriptions"""
@@ -110,16 +251,241 @@ class ContactScoringService:
             Comprehensive scoring result
         """
         
-        weights = custom_weights or self.default_weights
+        weight_vector = self._get_weight_vector(custom_weights)
+        offsets, columns = self._build_content_columns([interactions])
+        content_scores = self._reduce_content_columns(offsets, columns)[0]
+        
+        return self._build_score_result(
+            contact_data,
+            interactions,
+            weight_vector,
+            content_scores,
+            datetime.now(timezone.utc)
+        )
+    
+    async def score_contacts_batch(
+        self,
+        contacts_data: List[Dict[str, Any]],
+        custom_weights: Optional[ScoringWeights] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score multiple contacts in batch
+        
+        Args:
+            contacts_data: List of contact data with interactions
+            custom_weights: Optional custom scoring weights
+            
+        Returns:
+            List of scoring results
+        """
+        
+        weight_vector = self._get_weight_vector(custom_weights)
+        
+        # Scoring is pure CPU work; run it in a worker thread so large batches
+        # do not block the event loop (threads avoid pickling the interactions)
+        return await asyncio.to_thread(self._score_contacts_columnar, contacts_data, weight_vector)
+    
+    def _get_weight_vector(self, custom_weights: Optional[ScoringWeights]) -> Tuple[float, ...]:
+        """Resolve the weight vector, reusing the cached default when no custom weights are given"""
+        if custom_weights is None:
+            return self._default_weight_vector
+        return custom_weights.as_vector()
+    
+    def _score_contacts_columnar(
+        self,
+        contacts_data: List[Dict[str, Any]],
+        weight_vector: Tuple[float, ...]
+    ) -> List[Dict[str, Any]]:
+        """
+        Score many contacts with a single flat pass over all interaction content
+        
+        The per-interaction content features (depth, sentiment, engagement) are
+        computed once for every interaction in the batch and reduced per contact
+        segment, so the text of each interaction is only tokenized once.
+        """
+        
+        offsets = [0]
+        columns = {"depth": [], "sentiment": [], "engagement": []}
+        scorable = []
+        
+        # Build each contact's segment on its own so one malformed contact cannot sink the batch
+        for contact_item in contacts_data:
+            try:
+                self._append_content_segment(contact_item["interactions"], columns)
+            except Exception as e:
+                contact_data = contact_item.get("contact_data") or {}
+                logger.error(f"Error scoring contact {contact_data.get('id', 'unknown')}: {e}")
+                continue
+            
+            offsets.append(len(columns["depth"]))
+            scorable.append(contact_item)
+        
+        content_scores = self._reduce_content_columns(offsets, columns)
+        
+        # A single timestamp keeps recency and last_updated consistent across the batch
+        now = datetime.now(timezone.utc)
+        
+        results = []
+        
+        for contact_item, contact_content_scores in zip(scorable, content_scores):
+            contact_data = contact_item["contact_data"]
+            
+            try:
+                result = self._build_score_result(
+                    contact_data,
+                    contact_item["interactions"],
+                    weight_vector,
+                    contact_content_scores,
+                    now
+                )
+                results.append(result)
+            except Exception as e:
+                logger.error(f"Error scoring contact {contact_data.get('id', 'unknown')}: {e}")
+                # Continue with other contacts
+                continue
+        
+        return results
+    
+    def _build_content_columns(
+        self,
+        interaction_groups: List[List[Dict[str, Any]]]
+    ) -> Tuple[List[int], Dict[str, List[float]]]:
+        """
+        Flatten the interactions of many contacts into per-interaction feature columns
+        
+        Args:
+            interaction_groups: One list of interactions per contact
+            
+        Returns:
+            Segment offsets (contact i owns rows offsets[i]:offsets[i + 1]) and
+            the depth, sentiment and engagement feature columns
+        """
+        
+        offsets = [0]
+        columns = {"depth": [], "sentiment": [], "engagement": []}
+        
+        for interactions in interaction_groups:
+            self._append_content_segment(interactions, columns)
+            offsets.append(len(columns["depth"]))
+        
+        return offsets, columns
+    
+    def _append_content_segment(
+        self,
+        interactions: List[Dict[str, Any]],
+        columns: Dict[str, List[float]]
+    ) -> None:
+        """
+        Append one contact's per-interaction content features to the feature columns
+        
+        The segment is computed in full before any column is extended, so an
+        interaction that fails to score leaves the columns unchanged.
+        """
+        
+        depth_column = []
+        sentiment_column = []
+        engagement_column = []
+        
+        for interaction in interactions:
+            content = interaction.get("content", "")
+            interaction_type = interaction.get("interaction_type", "")
+            
+            engagement = 0.0
+            
+            # Duration for meetings/calls
+            if interaction_type in ("meeting", "call"):
+                duration = interaction.get("duration_minutes") or 0
+                if duration > 0:
+                    engagement += min(duration / 60, 1.0) * 0.5  # Normalize by hour
+            
+            if content:
+                lowered = content.lower()
+                word_count = len(content.split())
+                
+                # Communication depth
+                depth = min(word_count / 100, 1.0)  # Normalize by word count
+                if "?" in content:
+                    depth += 0.2
+                if any(keyword in lowered for keyword in self.DEPTH_KEYWORDS):
+                    depth += 0.3
+                depth = min(depth, 1.0)
+                
+                # Sentiment (0.0 = very negative, 0.5 = neutral, 1.0 = very positive)
+                sentiment_hits = [keyword for keyword in self.SENTIMENT_KEYWORDS if keyword in lowered]
+                if not sentiment_hits:
+                    sentiment = 0.5
+                else:
+                    positive_count = sum(1 for keyword in sentiment_hits if keyword in self.POSITIVE_KEYWORD_SET)
+                    negative_count = len(sentiment_hits) - positive_count
+                    sentiment = (positive_count + 0.5 * (word_count - positive_count - negative_count)) / word_count
+                    sentiment = max(0.0, min(1.0, sentiment))
+                
+                # Content quality
+                engagement += min(word_count / 50, 1.0) * 0.3  # Normalize by 50 words
+                if any(indicator in lowered for indicator in self.ENGAGEMENT_INDICATORS):
+                    engagement += 0.2
+            else:
+                depth = 0.1
+                sentiment = 0.5
+            
+            engagement += self.TYPE_QUALITY.get(interaction_type, 0.3)
+            
+            depth_column.append(depth)
+            sentiment_column.append(sentiment)
+            engagement_column.append(min(engagement, 1.0))
+        
+        columns["depth"].extend(depth_column)
+        columns["sentiment"].extend(sentiment_column)
+        columns["engagement"].extend(engagement_column)
+    
+    def _reduce_content_columns(
+        self,
+        offsets: List[int],
+        columns: Dict[str, List[float]]
+    ) -> List[Tuple[float, float, float]]:
+        """Reduce content feature columns to per-contact (depth, sentiment, engagement) means"""
+        
+        depth_column = columns["depth"]
+        sentiment_column = columns["sentiment"]
+        engagement_column = columns["engagement"]
+        
+        reduced = []
+        
+        for start, end in zip(offsets, offsets[1:]):
+            if start == end:
+                reduced.append((0.0, 0.5, 0.0))
+                continue
+            
+            count = end - start
+            reduced.append((
+                sum(depth_column[start:end]) / count,
+                sum(sentiment_column[start:end]) / count,
+                sum(engagement_column[start:end]) / count
+            ))
+        
+        return reduced
+    
+    def _build_score_result(
+        self,
+        contact_data: Dict[str, Any],
+        interactions: List[Dict[str, Any]],
+        weight_vector: Tuple[float, ...],
+        content_scores: Tuple[float, float, float],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Build the scoring result for one contact from its precomputed content scores"""
+        
+        # Normalize interactions once for all date-based metrics
+        records = self._normalize_interactions(interactions)
         
         # Calculate metrics
-        metrics = self._calculate_contact_metrics(contact_data, interactions)
+        metrics = self._calculate_contact_metrics(contact_data, records, content_scores, now)
         
         # Calculate component scores
         component_scores = self._calculate_component_scores(metrics, interactions)
         
         # Calculate overall score
-        overall_score = self._calculate_overall_score(component_scores, weights)
+        overall_score = self._calculate_overall_score(component_scores, weight_vector)
         
         # Determine tier
         tier = self._determine_tier(overall_score)
@@ -129,7 +495,7 @@ class ContactScoringService:
         recommendations = self._generate_recommendations(metrics, component_scores, tier)
         
         # Calculate confidence level
-        confidence_level = self._calculate_confidence_level(metrics, interactions)
+        confidence_level = self._calculate_confidence_level(metrics, records)
         
         return {
             "contact_id": contact_data.get("id", "unknown"),
@@ -165,49 +531,39 @@ class ContactScoringService:
             "recommendations": recommendations,
             "confidence_level": round(confidence_level, 3),
             "score_interpretation": self._get_score_interpretation(overall_score, tier),
-            "last_updated": datetime.now(timezone.utc).isoformat()
+            "last_updated": now.isoformat()
         }
     
-    async def score_contacts_batch(
-        self,
-        contacts_data: List[Dict[str, Any]],
-        custom_weights: Optional[ScoringWeights] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Score multiple contacts in batch
-        
-        Args:
-            contacts_data: List of contact data with interactions
-            custom_weights: Optional custom scoring weights
-            
-        Returns:
-            List of scoring results
-        """
+    def _normalize_interactions(self, interactions: List[Dict[str, Any]]) -> List[InteractionRecord]:
+        """Convert interaction dicts into records sorted by date (oldest first)"""
         
-        results = []
+        records = []
         
-        for contact_item in contacts_data:
-            contact_data = contact_item["contact_data"]
-            interactions = contact_item["interactions"]
+        for interaction in interactions:
+            interaction_date = interaction.get("interaction_date", self.MIN_INTERACTION_DATE)
+            if isinstance(interaction_date, str):
+                interaction_date = datetime.fromisoformat(interaction_date.replace('Z', '+00:00'))
             
-            try:
-                result = await self.score_contact(contact_data, interactions, custom_weights)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error scoring contact {contact_data.get('id', 'unknown')}: {e}")
-                # Continue with other contacts
-                continue
+            records.append(InteractionRecord(
+                interaction_type=interaction.get("interaction_type"),
+                direction=interaction.get("direction"),
+                interaction_date=interaction_date
+            ))
         
-        return results
+        records.sort(key=lambda record: record.interaction_date)
+        
+        return records
     
     def _calculate_contact_metrics(
         self,
         contact_data: Dict[str, Any],
-        interactions: List[Dict[str, Any]]
+        records: List[InteractionRecord],
+        content_scores: Tuple[float, float, float],
+        now: datetime
     ) -> ContactMetrics:
-        """Calculate comprehensive metrics for a contact"""
+        """Calculate comprehensive metrics for a contact from its date-sorted records"""
         
-        if not interactions:
+        if not records:
             return ContactMetrics(
                 total_interactions=0,
                 email_count=0,
@@ -229,62 +585,46 @@ class ContactScoringService:
             )
         
         # Basic counts
-        total_interactions = len(interactions)
-        email_count = sum(1 for i in interactions if i.get("interaction_type") == "email")
-        meeting_count = sum(1 for i in interactions if i.get("interaction_type") == "meeting")
-        call_count = sum(1 for i in interactions if i.get("interaction_type") == "call")
-        
-        # Sort interactions by date
-        sorted_interactions = sorted(
-            interactions,
-            key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc)),
-            reverse=True
-        )
+        total_interactions = len(records)
+        email_records = [r for r in records if r.interaction_type == "email"]
+        email_count = len(email_records)
+        meeting_count = sum(1 for r in records if r.interaction_type == "meeting")
+        call_count = sum(1 for r in records if r.interaction_type == "call")
         
         # Days since last interaction
-        last_interaction_date = sorted_interactions[0].get("interaction_date")
-        if isinstance(last_interaction_date, str):
-            last_interaction_date = datetime.fromisoformat(last_interaction_date.replace('Z', '+00:00'))
-        
-        days_since_last = (datetime.now(timezone.utc) - last_interaction_date).days
+        last_interaction_date = records[-1].interaction_date
+        days_since_last = (now - last_interaction_date).days
         
         # Interaction frequency (per month)
-        first_interaction_date = sorted_interactions[-1].get("interaction_date")
-        if isinstance(first_interaction_date, str):
-            first_interaction_date = datetime.fromisoformat(first_interaction_date.replace('Z', '+00:00'))
-        
+        first_interaction_date = records[0].interaction_date
         total_days = (last_interaction_date - first_interaction_date).days + 1
         frequency_per_month = (total_interactions / max(total_days, 1)) * 30
         
         # Response rate calculation
-        response_rate = self._calculate_response_rate(interactions)
+        response_rate = self._calculate_response_rate(email_records)
         
         # Average response time
-        avg_response_time = self._calculate_avg_response_time(interactions)
+        avg_response_time = self._calculate_avg_response_time(email_records)
         
         # Meeting attendance rate
-        meeting_attendance_rate = self._calculate_meeting_attendance_rate(interactions)
-        
-        # Communication depth score
-        communication_depth_score = self._calculate_communication_depth(interactions)
+        meeting_attendance_rate = self._calculate_meeting_attendance_rate(meeting_count)
         
-        # Sentiment score
-        sentiment_score = self._calculate_sentiment_score(interactions)
+        # Communication depth, sentiment and engagement quality scores
+        communication_depth_score, sentiment_score, engagement_quality_score = content_scores
         
         # Professional relevance score
-        professional_relevance_score = self._calculate_professional_relevance(contact_data, interactions)
+        professional_relevance_score = self._calculate_professional_relevance(
+            contact_data, meeting_count, total_interactions
+        )
         
         # Relationship growth rate
-        relationship_growth_rate = self._calculate_relationship_growth_rate(interactions)
+        relationship_growth_rate = self._calculate_relationship_growth_rate(records)
         
         # Consistency score
-        consistency_score = self._calculate_consistency_score(interactions)
-        
-        # Engagement quality score
-        engagement_quality_score = self._calculate_engagement_quality(interactions)
+        consistency_score = self._calculate_consistency_score(records)
         
         # Interaction direction ratios
-        mutual_ratio, contact_initiated_ratio = self._calculate_interaction_ratios(interactions)
+        mutual_ratio, contact_initiated_ratio = self._calculate_interaction_ratios(records)
         
         return ContactMetrics(
             total_interactions=total_interactions,
@@ -306,134 +646,61 @@ class ContactScoringService:
             contact_initiated_ratio=contact_initiated_ratio
         )
     
-    def _calculate_response_rate(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate response rate based on email exchanges"""
+    def _calculate_response_rate(self, email_records: List[InteractionRecord]) -> float:
+        """Calculate response rate based on date-sorted email exchanges"""
         
-        email_interactions = [i for i in interactions if i.get("interaction_type") == "email"]
-        if len(email_interactions) < 2:
+        if len(email_records) < 2:
             return 0.5  # Neutral score for insufficient data
         
-        # Sort by date
-        email_interactions.sort(key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc)))
-        
         responses = 0
         outbound_emails = 0
         
-        for i, interaction in enumerate(email_interactions):
-            if interaction.get("direction") == "outbound":
+        for i, record in enumerate(email_records):
+            if record.direction == "outbound":
                 outbound_emails += 1
                 # Check if there's a response within 7 days
-                if i + 1 < len(email_interactions):
-                    next_interaction = email_interactions[i + 1]
-                    if next_interaction.get("direction") == "inbound":
-                        time_diff = (next_interaction.get("interaction_date") - interaction.get("interaction_date")).days
+                if i + 1 < len(email_records):
+                    next_record = email_records[i + 1]
+                    if next_record.direction == "inbound":
+                        time_diff = (next_record.interaction_date - record.interaction_date).days
                         if time_diff <= 7:
                             responses += 1
         
         return responses / max(outbound_emails, 1)
     
-    def _calculate_avg_response_time(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate average response time in hours"""
+    def _calculate_avg_response_time(self, email_records: List[InteractionRecord]) -> float:
+        """Calculate average response time in hours from date-sorted email exchanges"""
         
-        email_interactions = [i for i in interactions if i.get("interaction_type") == "email"]
-        if len(email_interactions) < 2:
+        if len(email_records) < 2:
             return 24.0  # Default 24 hours
         
-        email_interactions.sort(key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc)))
-        
         response_times = []
         
-        for i, interaction in enumerate(email_interactions):
-            if interaction.get("direction") == "outbound" and i + 1 < len(email_interactions):
-                next_interaction = email_interactions[i + 1]
-                if next_interaction.get("direction") == "inbound":
-                    time_diff = (next_interaction.get("interaction_date") - interaction.get("interaction_date")).total_seconds() / 3600
+        for i, record in enumerate(email_records):
+            if record.direction == "outbound" and i + 1 < len(email_records):
+                next_record = email_records[i + 1]
+                if next_record.direction == "inbound":
+                    time_diff = (next_record.interaction_date - record.interaction_date).total_seconds() / 3600
                     if time_diff <= 168:  # Within a week
                         response_times.append(time_diff)
         
-        return statistics.mean(response_times) if response_times else 24.0
+        return _mean(response_times) if response_times else 24.0
     
-    def _calculate_meeting_attendance_rate(self, interactions: List[Dict[str, Any]]) -> float:
+    def _calculate_meeting_attendance_rate(self, meeting_count: int) -> float:
         """Calculate meeting attendance rate"""
         
-        meetings = [i for i in interactions if i.get("interaction_type") == "meeting"]
-        if not meetings:
+        if not meeting_count:
             return 0.5  # Neutral score for no meetings
         
         # Assume all logged meetings were attended (in real implementation, check for cancellations)
         return 1.0
     
-    def _calculate_communication_depth(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate communication depth based on content length and complexity"""
-        
-        if not interactions:
-            return 0.0
-        
-        depth_scores = []
-        
-        for interaction in interactions:
-            content = interaction.get("content", "")
-            if not content:
-                depth_scores.append(0.1)
-                continue
-            
-            # Basic depth indicators
-            word_count = len(content.split())
-            has_questions = "?" in content
-            has_detailed_info = any(keyword in content.lower() for keyword in [
-                "project", "meeting", "discussion", "proposal", "plan", "strategy"
-            ])
-            
-            # Calculate depth score
-            depth = min(word_count / 100, 1.0)  # Normalize by word count
-            if has_questions:
-                depth += 0.2
-            if has_detailed_info:
-                depth += 0.3
-            
-            depth_scores.append(min(depth, 1.0))
-        
-        return statistics.mean(depth_scores)
-    
-    def _calculate_sentiment_score(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate sentiment score based on content analysis"""
-        
-        if not interactions:
-            return 0.5  # Neutral
-        
-        positive_keywords = [
-            "thanks", "great", "excellent", "wonderful", "appreciate", "love",
-            "fantastic", "amazing", "perfect", "brilliant", "outstanding"
-        ]
-        
-        negative_keywords = [
-            "sorry", "unfortunately", "problem", "issue", "concern", "worried",
-            "disappointed", "frustrated", "difficult", "challenging"
-        ]
-        
-        sentiment_scores = []
-        
-        for interaction in interactions:
-            content = interaction.get("content", "").lower()
-            if not content:
-                sentiment_scores.append(0.5)
-                continue
-            
-            positive_count = sum(1 for keyword in positive_keywords if keyword in content)
-            negative_count = sum(1 for keyword in negative_keywords if keyword in content)
-            
-            # Calculate sentiment (0.0 = very negative, 0.5 = neutral, 1.0 = very positive)
-            if positive_count + negative_count == 0:
-                sentiment = 0.5
-            else:
-                sentiment = (positive_count + 0.5 * (len(content.split()) - positive_count - negative_count)) / len(content.split())
-                sentiment = max(0.0, min(1.0, sentiment))
-            
-            sentiment_scores.append(sentiment)
-        
-        return statistics.mean(sentiment_scores)
-    
-    def _calculate_professional_relevance(self, contact_data: Dict[str, Any], interactions: List[Dict[str, Any]]) -> float:
+    def _calculate_professional_relevance(
+        self,
+        contact_data: Dict[str, Any],
+        meeting_count: int,
+        total_interactions: int
+    ) -> float:
         """Calculate professional relevance score"""
         
         relevance_score = 0.0
@@ -453,31 +720,25 @@ class ContactScoringService:
             relevance_score += 0.3
         
         # Meeting-based interactions indicate professional relationship
-        meeting_ratio = len([i for i in interactions if i.get("interaction_type") == "meeting"]) / max(len(interactions), 1)
+        meeting_ratio = meeting_count / max(total_interactions, 1)
         relevance_score += meeting_ratio * 0.4
         
         return min(relevance_score, 1.0)
     
-    def _calculate_relationship_growth_rate(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate relationship growth rate over time"""
+    def _calculate_relationship_growth_rate(self, records: List[InteractionRecord]) -> float:
+        """Calculate relationship growth rate over time from date-sorted records"""
         
-        if len(interactions) < 3:
+        if len(records) < 3:
             return 0.5  # Neutral for insufficient data
         
-        # Sort interactions by date
-        sorted_interactions = sorted(
-            interactions,
-            key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc))
-        )
-        
         # Split into first half and second half
-        mid_point = len(sorted_interactions) // 2
-        first_half = sorted_interactions[:mid_point]
-        second_half = sorted_interactions[mid_point:]
+        mid_point = len(records) // 2
+        first_half = records[:mid_point]
+        second_half = records[mid_point:]
         
         # Calculate interaction frequency for each half
-        first_half_days = (first_half[-1].get("interaction_date") - first_half[0].get("interaction_date")).days + 1
-        second_half_days = (second_half[-1].get("interaction_date") - second_half[0].get("interaction_date")).days + 1
+        first_half_days = (first_half[-1].interaction_date - first_half[0].interaction_date).days + 1
+        second_half_days = (second_half[-1].interaction_date - second_half[0].interaction_date).days + 1
         
         first_half_frequency = len(first_half) / max(first_half_days, 1)
         second_half_frequency = len(second_half) / max(second_half_days, 1)
@@ -491,33 +752,27 @@ class ContactScoringService:
         # Normalize to 0-1 scale
         return max(0.0, min(1.0, (growth_rate + 1) / 2))
     
-    def _calculate_consistency_score(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate consistency of interactions over time"""
+    def _calculate_consistency_score(self, records: List[InteractionRecord]) -> float:
+        """Calculate consistency of interactions over time from date-sorted records"""
         
-        if len(interactions) < 3:
+        if len(records) < 3:
             return 0.5
         
-        # Sort interactions by date
-        sorted_interactions = sorted(
-            interactions,
-            key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc))
-        )
-        
         # Calculate gaps between interactions
         gaps = []
-        for i in range(1, len(sorted_interactions)):
-            gap = (sorted_interactions[i].get("interaction_date") - sorted_interactions[i-1].get("interaction_date")).days
+        for i in range(1, len(records)):
+            gap = (records[i].interaction_date - records[i-1].interaction_date).days
             gaps.append(gap)
         
         if not gaps:
             return 0.5
         
         # Calculate coefficient of variation (lower = more consistent)
-        mean_gap = statistics.mean(gaps)
+        mean_gap = _mean(gaps)
         if mean_gap == 0:
             return 1.0
         
-        std_gap = statistics.stdev(gaps) if len(gaps) > 1 else 0
+        std_gap = _stdev(gaps) if len(gaps) > 1 else 0
         cv = std_gap / mean_gap
         
         # Convert to consistency score (0 = inconsistent, 1 = very consistent)
@@ -525,57 +780,16 @@ class ContactScoringService:
         
         return consistency
     
-    def _calculate_engagement_quality(self, interactions: List[Dict[str, Any]]) -> float:
-        """Calculate overall engagement quality"""
-        
-        if not interactions:
-            return 0.0
-        
-        quality_indicators = []
-        
-        for interaction in interactions:
-            quality = 0.0
-            
-            # Duration for meetings/calls
-            if interaction.get("interaction_type") in ["meeting", "call"]:
-                duration = interaction.get("duration_minutes", 0)
-                if duration > 0:
-                    quality += min(duration / 60, 1.0) * 0.5  # Normalize by hour
-            
-            # Content quality for emails
-            content = interaction.get("content", "")
-            if content:
-                word_count = len(content.split())
-                quality += min(word_count / 50, 1.0) * 0.3  # Normalize by 50 words
-                
-                # Check for engagement indicators
-                if any(indicator in content.lower() for indicator in ["question", "?", "thoughts", "opinion"]):
-                    quality += 0.2
-            
-            # Interaction type quality
-            type_quality = {
-                "meeting": 1.0,
-                "call": 0.8,
-                "email": 0.6,
-                "message": 0.4
-            }
-            quality += type_quality.get(interaction.get("interaction_type", ""), 0.3)
-            
-            quality_indicators.append(min(quality, 1.0))
-        
-        return statistics.mean(quality_indicators)
-    
-    def _calculate_interaction_ratios(self, interactions: List[Dict[str, Any]]) -> Tuple[float, float]:
+    def _calculate_interaction_ratios(self, records: List[InteractionRecord]) -> Tuple[float, float]:
         """Calculate mutual interaction ratio and contact-initiated ratio"""
         
-        if not interactions:
+        if not records:
             return 0.0, 0.0
         
-        mutual_count = sum(1 for i in interactions if i.get("direction") == "mutual")
-        inbound_count = sum(1 for i in interactions if i.get("direction") == "inbound")
-        outbound_count = sum(1 for i in interactions if i.get("direction") == "outbound")
+        mutual_count = sum(1 for r in records if r.direction == "mutual")
+        inbound_count = sum(1 for r in records if r.direction == "inbound")
         
-        total = len(interactions)
+        total = len(records)
         mutual_ratio = mutual_count / total
         contact_initiated_ratio = inbound_count / total
         
@@ -612,6 +826,7 @@ class ContactScoringService:
         # Relationship trajectory score
         trajectory_score = (metrics.relationship_growth_rate + metrics.consistency_score) / 2
         
+        # Keys follow the same order as ScoringWeights.as_vector()
         return {
             "frequency": frequency_score,
             "recency": recency_score,
@@ -626,33 +841,20 @@ class ContactScoringService:
     def _calculate_overall_score(
         self,
         component_scores: Dict[str, float],
-        weights: ScoringWeights
+        weight_vector: Tuple[float, ...]
     ) -> float:
-        """Calculate weighted overall score"""
-        
-        overall_score = (
-            component_scores["frequency"] * weights.frequency_weight +
-            component_scores["recency"] * weights.recency_weight +
-            component_scores["meeting_consistency"] * weights.meeting_consistency_weight +
-            component_scores["response_reliability"] * weights.response_reliability_weight +
-            component_scores["communication_quality"] * weights.communication_quality_weight +
-            component_scores["sentiment"] * weights.sentiment_weight +
-            component_scores["professional_context"] * weights.professional_context_weight +
-            component_scores["trajectory"] * weights.relationship_trajectory_weight
-        )
+        """Calculate weighted overall score as a dot product of components and weights"""
+        
+        overall_score = sum(map(mul, component_scores.values(), weight_vector))
         
         return max(0.0, min(1.0, overall_score))
     
     def _determine_tier(self, overall_score: float) -> str:
         """Determine contact tier based on overall score"""
         
-        for tier, threshold in self.tier_thresholds.items():
-            if overall_score >= threshold:
-                return tier
-        
-        return "dormant"
+        return self._tier_names[bisect_right(self._tier_bounds, overall_score)]
     
-    def _calculate_confidence_level(self, metrics: ContactMetrics, interactions: List[Dict[str, Any]]) -> float:
+    def _calculate_confidence_level(self, metrics: ContactMetrics, records: List[InteractionRecord]) -> float:
         """Calculate confidence level in the scoring"""
         
         confidence_factors = []
@@ -662,23 +864,19 @@ class ContactScoringService:
         confidence_factors.append(interaction_confidence)
         
         # Time span confidence
-        if interactions:
-            sorted_interactions = sorted(
-                interactions,
-                key=lambda x: x.get("interaction_date", datetime.min.replace(tzinfo=timezone.utc))
-            )
-            time_span_days = (sorted_interactions[-1].get("interaction_date") - sorted_interactions[0].get("interaction_date")).days
+        if records:
+            time_span_days = (records[-1].interaction_date - records[0].interaction_date).days
             time_confidence = min(time_span_days / 180, 1.0)  # 6 months = full confidence
             confidence_factors.append(time_confidence)
         else:
             confidence_factors.append(0.0)
         
         # Interaction diversity confidence
-        interaction_types = set(i.get("interaction_type") for i in interactions)
+        interaction_types = set(r.interaction_type for r in records)
         diversity_confidence = min(len(interaction_types) / 3, 1.0)  # 3+ types = full confidence
         confidence_factors.append(diversity_confidence)
         
-        return statistics.mean(confidence_factors)
+        return _mean(confidence_factors)
     
     def _generate_insights(
         self,
@@ -690,41 +888,13 @@ class ContactScoringService:
         
         insights = []
         
-        # Frequency insights
-        if component_scores["frequency"] > 0.8:
-            insights.append("Very active relationship with frequent interactions")
-        elif component_scores["frequency"] < 0.3:
-            insights.append("Low interaction frequency - relationship may need more attention")
-        
-        # Recency insights
-        if metrics.days_since_last_interaction > 60:
-            insights.append(f"No recent contact for {metrics.days_since_last_interaction} days - consider reaching out")
-        elif metrics.days_since_last_interaction < 7:
-            insights.append("Recent active communication indicates strong engagement")
-        
-        # Response reliability insights
-        if metrics.response_rate > 0.8:
-            insights.append("Highly responsive contact - reliable for important communications")
-        elif metrics.response_rate < 0.3:
-            insights.append("Low response rate - may prefer alternative communication methods")
-        
-        # Professional context insights
-        if metrics.professional_relevance_score > 0.7:
-            insights.append("Strong professional relationship with business relevance")
-        
-        # Sentiment insights
-        if metrics.sentiment_score > 0.7:
-            insights.append("Positive communication tone indicates good relationship health")
-        elif metrics.sentiment_score < 0.4:
-            insights.append("Communication tone suggests potential relationship challenges")
-        
-        # Growth insights
-        if metrics.relationship_growth_rate > 0.7:
-            insights.append("Relationship is strengthening over time")
-        elif metrics.relationship_growth_rate < 0.3:
-            insights.append("Relationship activity has declined - may need re-engagement")
-        
-        return insights[:5]  # Limit to top 5 insights
+        for predicate, template in self.INSIGHT_RULES:
+            if predicate(metrics, component_scores):
+                insights.append(template.format(metrics=metrics))
+                if len(insights) == self.MAX_INSIGHTS:
+                    break
+        
+        return insights
     
     def _generate_recommendations(
         self,
@@ -737,47 +907,19 @@ class ContactScoringService:
         recommendations = []
         
         # Tier-based recommendations
-        if tier == "dormant":
-            recommendations.append("Schedule a catch-up call or send a re-engagement email")
-            recommendations.append("Share relevant industry news or insights to restart conversation")
-        elif tier == "peripheral":
-            recommendations.append("Increase interaction frequency with regular check-ins")
-            recommendations.append("Invite to relevant events or meetings")
-        elif tier == "active_network":
-            recommendations.append("Maintain current engagement level with periodic updates")
-            recommendations.append("Look for collaboration opportunities")
-        elif tier == "strong_network":
-            recommendations.append("Leverage this relationship for strategic initiatives")
-            recommendations.append("Consider introducing them to other valuable contacts")
-        elif tier == "inner_circle":
-            recommendations.append("Continue nurturing this key relationship")
-            recommendations.append("Seek their input on important decisions")
+        recommendations.extend(self.TIER_RECOMMENDATIONS.get(tier, ()))
         
         # Specific metric-based recommendations
-        if metrics.response_rate < 0.5:
-            recommendations.append("Try different communication channels (phone vs email)")
-        
-        if metrics.meeting_count == 0 and metrics.total_interactions > 5:
-            recommendations.append("Suggest a face-to-face or video meeting to deepen the relationship")
+        for predicate, message in self.RECOMMENDATION_RULES:
+            if len(recommendations) >= self.MAX_RECOMMENDATIONS:
+                break
+            if predicate(metrics, component_scores):
+                recommendations.append(message)
         
-        if component_scores["sentiment"] < 0.5:
-            recommendations.append("Address any potential concerns or misunderstandings")
-        
-        if metrics.days_since_last_interaction > 30:
-            recommendations.append("Send a personalized message to re-establish contact")
-        
-        return recommendations[:4]  # Limit to top 4 recommendations
+        return recommendations[:self.MAX_RECOMMENDATIONS]
     
     def _get_score_interpretation(self, overall_score: float, tier: str) -> str:
         """Get human-readable score interpretation"""
         
-        if overall_score >= 0.8:
-            return f"Excellent relationship quality ({tier}). This is a key professional contact with strong, consistent engagement."
-        elif overall_score >= 0.6:
-            return f"Good relationship quality ({tier}). Regular interaction with positive engagement patterns."
-        elif overall_score >= 0.4:
-            return f"Moderate relationship quality ({tier}). Some engagement but room for improvement."
-        elif overall_score >= 0.2:
-            return f"Limited relationship quality ({tier}). Minimal interaction - consider re-engagement strategies."
-        else:
-            return f"Inactive relationship ({tier}). No recent meaningful interaction - may need significant re-engagement effort." 
\ No newline at end of file
+        template = self.SCORE_INTERPRETATIONS[bisect_right(self.SCORE_INTERPRETATION_BOUNDS, overall_score)]
+        return template.format(tier=tier) 
\ No newline at end of file
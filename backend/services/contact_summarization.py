@@ -6,15 +6,21 @@ leveraging existing infrastructure from conversation threading, AI assistant,
 and contact management systems.
 """
 
+import asyncio
+import copy
 import json
 import hashlib
+import re
+from itertools import groupby
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, desc, func
 
+from lib.cache import TTLCache, get_redis_client
 from lib.llm_client import get_openai_client, OpenAIModel
 from lib.logger import logger
 from models.orm.contact import Contact
@@ -23,9 +29,33 @@ from services.conversation_threading_service import ConversationThread
 from services.ai_assistant import AIAssistantService
 from services.conversation_threading_service import ConversationThreadingService
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # logger already imported from lib.logger
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
+
+def _json_loads(value: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# Markdown code fence wrapped around JSON responses, e.g. ```json ... ```
+_JSON_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+
 class ContactSummarizationError(Exception):
     """Exception raised for contact summarization errors."""
     pass
@@ -40,15 +70,160 @@ class SummaryType:
     UPDATES = "updates"
 
 
+# Process-wide summary cache shared across requests
+local_summary_cache = TTLCache(maxsize=1024)
+
+
 class ContactSummarizationService:
     """Service for generating AI-powered contact summaries."""
     
+    # Upper bound on how long a summary is served from process memory. Kept short
+    # because invalidations in other processes only reach Redis.
+    LOCAL_CACHE_TTL_SECONDS = 300
+    
+    # interaction_data type used to force invalidation regardless of contact state
+    MANUAL_INVALIDATION = "manual_cache_invalidation"
+    
+    # Prefix for summary cache keys: contact_summary:{user_id}:{contact_id}:{summary_type}
+    CACHE_KEY_PREFIX = "contact_summary:"
+    
+    # Most recent interactions included in a summary
+    INTERACTIONS_PER_CONTACT = 20
+    
+    # Interactions fetched per summary type, sized to what each prompt uses
+    INTERACTION_LIMIT = {
+        SummaryType.BRIEF: 5,
+        SummaryType.PRE_MEETING: 5,
+        SummaryType.UPDATES: 10,
+        SummaryType.COMPREHENSIVE: 20,
+        SummaryType.RELATIONSHIP_STATUS: 20
+    }
+    
+    # Summary types whose prompts include conversation threads
+    THREADED_SUMMARY_TYPES = frozenset({SummaryType.COMPREHENSIVE, SummaryType.PRE_MEETING})
+    
+    # Interaction columns read when building prompts
+    SUMMARY_INTERACTION_COLUMNS = (
+        Interaction.id,
+        Interaction.interaction_type,
+        Interaction.interaction_date,
+        Interaction.content_summary,
+        Interaction.subject,
+        Interaction.source_platform,
+        Interaction.platform_metadata
+    )
+    
+    COMPREHENSIVE_PROMPT = """
+{base_context}
+
+Recent Interactions:
+{interactions}
+
+Conversation Threads:
+{threads}
+
+Generate a comprehensive summary of this contact including:
+1. Professional background and current role
+2. Relationship history and key interactions
+3. Communication patterns and preferences
+4. Key topics of mutual interest
+5. Relationship strength assessment
+6. Recommended next steps
+
+Format as JSON with keys: summary, talking_points, insights
+"""
+    
+    BRIEF_PROMPT = """
+{base_context}
+
+Recent Activity:
+{interactions}
+
+Generate a brief contact summary including:
+1. Who they are professionally
+2. Recent interaction highlights
+3. Current relationship status
+4. 2-3 key talking points
+
+Format as JSON with keys: summary, talking_points
+"""
+    
+    PRE_MEETING_PROMPT = """
+{base_context}
+
+Meeting Context: {meeting_context}
+
+Recent Interactions:
+{interactions}
+
+Recent Conversations:
+{threads}
+
+Generate a pre-meeting summary including:
+1. Key background information
+2. Recent conversation topics
+3. Potential talking points for the meeting
+4. Any follow-ups or commitments to address
+5. Meeting-specific preparation notes
+
+Format as JSON with keys: summary, talking_points, meeting_notes
+"""
+    
+    RELATIONSHIP_STATUS_PROMPT = """
+{base_context}
+
+Communication History:
+{interactions}
+
+Assess the relationship status including:
+1. Current relationship health (strong/moderate/weak/cold)
+2. Communication frequency trends
+3. Engagement level analysis
+4. Risk factors (going cold, decreased interaction)
+5. Recommended actions to maintain/strengthen relationship
+
+Format as JSON with keys: summary, insights, recommendations
+"""
+    
+    UPDATES_PROMPT = """
+{base_context}
+
+Recent Updates (Last 30 days):
+{interactions}
+
+Summarize what's new with this contact:
+1. Recent interactions and conversations
+2. Any changes in communication patterns
+3. New developments or topics discussed
+4. Action items or follow-ups needed
+
+Format as JSON with keys: summary, recent_changes, action_items
+"""
+    
+    # Prompt per summary type: (template, interactions included, threads included)
+    PROMPT_TEMPLATES = {
+        SummaryType.COMPREHENSIVE: (COMPREHENSIVE_PROMPT, 10, 3),
+        SummaryType.BRIEF: (BRIEF_PROMPT, 5, 0),
+        SummaryType.PRE_MEETING: (PRE_MEETING_PROMPT, 5, 2),
+        SummaryType.RELATIONSHIP_STATUS: (RELATIONSHIP_STATUS_PROMPT, None, 0),
+        SummaryType.UPDATES: (UPDATES_PROMPT, 10, 0)
+    }
+    
     def __init__(self, db: Session):
         self.db = db
         self.ai_service = AIAssistantService(db)
         self.threading_service = ConversationThreadingService(db)
         self.openai_client = get_openai_client()
         
+        # Shared Redis client for summary caching
+        try:
+            self.redis_client = get_redis_client()
+        except Exception as e:
+            logger.error(f"Failed to initialize summary cache Redis client: {e}")
+            self.redis_client = None
+        
+        self.local_cache = local_summary_cache
+        
         # Cache settings
         self.cache_duration_hours = {
             SummaryType.COMPREHENSIVE: 24,
@@ -57,6 +232,12 @@ class ContactSummarizationService:
             SummaryType.RELATIONSHIP_STATUS: 168,  # 1 week
             SummaryType.UPDATES: 6
         }
+        
+        # Maximum summaries generated concurrently in batch operations
+        self.batch_concurrency = 8
+        
+        # Seconds a single contact may take in batch operations before it is skipped
+        self.batch_summary_timeout = 30.0
     
     async def generate_contact_summary(
         self,
@@ -80,55 +261,95 @@ class ContactSummarizationService:
             Dictionary containing the generated summary and metadata
         """
         try:
+            # One timestamp for generated_at, expires_at and days_since_last_contact
+            now = datetime.utcnow()
+            
             # Get contact with validation
             contact = self._get_contact_with_validation(contact_id, user_id)
             
-            # Check cache first (unless force refresh)
-            if not force_refresh:
-                cached_summary = await self._get_cached_summary(
-                    contact_id, user_id, summary_type
-                )
-                if cached_summary:
-                    return cached_summary
-            
-            # Gather contact data
-            contact_data = await self._gather_contact_data(contact_id, user_id)
-            
-            # Generate summary based on type
-            summary_content = await self._generate_summary_content(
-                contact_data, summary_type, meeting_context
+            return await self._summarize_contact(
+                contact, user_id, summary_type, meeting_context, force_refresh, now=now
             )
             
-            # Create summary response
-            summary = {
-                "contact_id": str(contact_id),
-                "contact_name": contact.full_name,
-                "contact_email": contact.email,
-                "summary_type": summary_type,
-                "summary": summary_content["content"],
-                "talking_points": summary_content.get("talking_points", []),
-                "relationship_insights": summary_content.get("relationship_insights", {}),
-                "last_interaction": contact_data.get("last_interaction_date"),
-                "interaction_count": contact_data.get("interaction_count", 0),
-                "relationship_strength": contact_data.get("relationship_strength", 0.0),
-                "generated_at": datetime.utcnow().isoformat(),
-                "expires_at": (datetime.utcnow() + timedelta(
-                    hours=self.cache_duration_hours[summary_type]
-                )).isoformat(),
-                "cached": False,
-                "model_used": summary_content.get("model_used", "gpt-3.5-turbo"),
-                "token_usage": summary_content.get("token_usage")
-            }
-            
-            # Cache the summary
-            await self._cache_summary(contact_id, user_id, summary_type, summary)
-            
-            return summary
-            
         except Exception as e:
             logger.error(f"Error generating contact summary: {e}")
             raise ContactSummarizationError(f"Failed to generate summary: {str(e)}")
     
+    async def _summarize_contact(
+        self,
+        contact: Contact,
+        user_id: UUID,
+        summary_type: str,
+        meeting_context: Optional[str] = None,
+        force_refresh: bool = False,
+        interactions: Optional[List[Interaction]] = None,
+        now: Optional[datetime] = None,
+        threads: Optional[List[Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate (or fetch from cache) the summary for an already validated contact.
+        
+        Args:
+            contact: Contact owned by the requesting user
+            user_id: ID of the requesting user
+            summary_type: Type of summary to generate
+            meeting_context: Optional context for pre-meeting summaries
+            force_refresh: Skip cache and generate fresh summary
+            interactions: Preloaded recent interactions, newest first
+            now: Reference time for the summary, defaults to the current UTC time
+            threads: Preloaded conversation threads for the contact
+            
+        Returns:
+            Dictionary containing the generated summary and metadata
+        """
+        contact_id = contact.id
+        content_hash = self._compute_content_hash(contact)
+        now = now or datetime.utcnow()
+        
+        # Check cache first (unless force refresh)
+        if not force_refresh:
+            cached_summary = await self._get_cached_summary(
+                contact_id, user_id, summary_type, content_hash=content_hash
+            )
+            if cached_summary:
+                return cached_summary
+        
+        # Gather contact data
+        contact_data = await self._gather_contact_data(
+            contact, user_id, interactions, now=now, summary_type=summary_type, threads=threads
+        )
+        
+        # Generate summary based on type
+        summary_content = await self._generate_summary_content(
+            contact_data, summary_type, meeting_context
+        )
+        
+        # Create summary response
+        summary = {
+            "contact_id": str(contact_id),
+            "contact_name": contact.full_name,
+            "contact_email": contact.email,
+            "summary_type": summary_type,
+            "summary": summary_content["content"],
+            "talking_points": summary_content.get("talking_points", []),
+            "relationship_insights": summary_content.get("relationship_insights", {}),
+            "last_interaction": contact_data.get("last_interaction_date"),
+            "interaction_count": contact_data.get("interaction_count", 0),
+            "relationship_strength": contact_data.get("relationship_strength", 0.0),
+            "generated_at": now.isoformat(),
+            "expires_at": (now + timedelta(
+                hours=self.cache_duration_hours[summary_type]
+            )).isoformat(),
+            "cached": False,
+            "model_used": summary_content.get("model_used", "gpt-3.5-turbo"),
+            "token_usage": summary_content.get("token_usage")
+        }
+        
+        # Cache the summary
+        await self._cache_summary(contact_id, user_id, summary_type, summary, content_hash)
+        
+        return summary
+    
     async def get_cached_summary(
         self,
         contact_id: UUID,
@@ -185,11 +406,25 @@ class ContactSummarizationService:
     ) -> bool:
         """Update contact summary when new interaction occurs."""
         try:
-            # Invalidate existing summaries to force refresh
-            await self._invalidate_cached_summaries(contact_id, user_id)
+            if interaction_data.get("type") == self.MANUAL_INVALIDATION:
+                # Invalidate existing summaries to force refresh
+                await self._invalidate_cached_summaries(contact_id, user_id)
+                logger.info(f"Summary cache invalidated for contact {contact_id} on request")
+                return True
+            
+            # Only drop summaries built from a different contact state
+            contact = self._get_contact_with_validation(contact_id, user_id)
+            invalidated = await self._invalidate_stale_summaries(
+                contact_id, user_id, self._compute_content_hash(contact)
+            )
             
             # Log the interaction trigger
-            logger.info(f"Summary cache invalidated for contact {contact_id} due to new interaction")
+            logger.info(
+                f"Invalidated {invalidated} cached summaries for contact {contact_id} due to new interaction"
+            )
+            
+            # Regenerate the contact's thread summaries in the background, ahead of the next read
+            await self.threading_service.schedule_summary_refresh_async(str(user_id), str(contact_id))
             
             return True
             
@@ -208,21 +443,89 @@ class ContactSummarizationService:
         try:
             # Limit batch size for performance
             limited_contacts = contact_ids[:max_contacts]
-            summaries = []
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+            now = datetime.utcnow()
+            
+            # Preload all contacts and their recent interactions in two queries
+            contacts = {
+                str(contact.id): contact
+                for contact in self.db.query(Contact).filter(
+                    and_(Contact.user_id == user_id, Contact.id.in_(limited_contacts))
+                ).all()
+            }
+            interactions_by_contact = self._fetch_recent_interactions_batch(
+                list(contacts), user_id, self._interaction_limit(summary_type)
+            )
             
-            for contact_id in limited_contacts:
+            # Serve cached summaries first; the lookups touch only the caches, not the session
+            cached = await asyncio.gather(*(
+                self._get_cached_summary(
+                    contact.id, user_id, summary_type,
+                    content_hash=self._compute_content_hash(contact)
+                )
+                for contact in contacts.values()
+            ))
+            cached_by_contact = dict(zip(contacts, cached))
+            
+            # Threads are built through the shared Session, which is not safe for
+            # concurrent use, so load them one contact at a time before fanning out
+            threads_by_contact = {}
+            for key, contact in contacts.items():
+                if cached_by_contact[key] is not None:
+                    continue
                 try:
-                    summary = await self.generate_contact_summary(
-                        contact_id=contact_id,
-                        user_id=user_id,
-                        summary_type=summary_type,
-                        force_refresh=False  # Use cache for batch operations
+                    threads_by_contact[key] = await self._fetch_contact_threads(
+                        contact, user_id, summary_type
                     )
-                    summaries.append(summary)
                 except Exception as e:
-                    logger.warning(f"Failed to generate summary for contact {contact_id}: {e}")
+                    # Fail only this contact, as the per-contact task would have
+                    threads_by_contact[key] = e
+            
+            async def summarize(contact_id: UUID) -> Dict[str, Any]:
+                key = str(contact_id)
+                contact = contacts.get(key)
+                if contact is None:
+                    raise ContactSummarizationError(f"Contact {contact_id} not found or access denied")
+                if cached_by_contact[key] is not None:
+                    return cached_by_contact[key]
+                threads = threads_by_contact[key]
+                if isinstance(threads, Exception):
+                    raise threads
+                
+                async with semaphore:
+                    # Bound each contact so one slow LLM call cannot stall the batch
+                    return await asyncio.wait_for(
+                        self._summarize_contact(
+                            contact,
+                            user_id,
+                            summary_type,
+                            force_refresh=True,  # Cache already checked above
+                            interactions=interactions_by_contact.get(key, []),
+                            now=now,
+                            threads=threads
+                        ),
+                        timeout=self.batch_summary_timeout
+                    )
+            
+            # Only the LLM calls overlap now; all database work above ran serially
+            results = await asyncio.gather(
+                *(summarize(contact_id) for contact_id in limited_contacts),
+                return_exceptions=True
+            )
+            
+            summaries = []
+            for contact_id, result in zip(limited_contacts, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.warning(
+                        f"Timed out generating summary for contact {contact_id} "
+                        f"after {self.batch_summary_timeout}s"
+                    )
+                    continue
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to generate summary for contact {contact_id}: {result}")
                     # Continue with other contacts
                     continue
+                summaries.append(result)
             
             return summaries
             
@@ -230,6 +533,23 @@ class ContactSummarizationService:
             logger.error(f"Error generating batch summaries: {e}")
             raise ContactSummarizationError(f"Failed to generate batch summaries: {str(e)}")
     
+    async def _fetch_contact_threads(
+        self,
+        contact: Contact,
+        user_id: UUID,
+        summary_type: Optional[str] = None
+    ) -> List[Any]:
+        """Recent conversation threads for a contact, or none if the summary type does not use them."""
+        if summary_type is not None and summary_type not in self.THREADED_SUMMARY_TYPES:
+            return []
+        
+        return await self.threading_service.build_conversation_threads(
+            user_id=str(user_id),
+            contact_id=str(contact.id),
+            days_back=90,
+            limit=5
+        )
+    
     def _get_contact_with_validation(self, contact_id: UUID, user_id: UUID) -> Contact:
         """Get contact and validate user access."""
         contact = self.db.query(Contact).filter(
@@ -241,45 +561,94 @@ class ContactSummarizationService:
         
         return contact
     
-    async def _gather_contact_data(self, contact_id: UUID, user_id: UUID) -> Dict[str, Any]:
-        """Gather all relevant data for contact summarization."""
+    def _fetch_recent_interactions_batch(
+        self,
+        contact_ids: List[str],
+        user_id: UUID,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[Interaction]]:
+        """Fetch the most recent interactions of many contacts in one query, grouped by contact."""
+        if not contact_ids:
+            return {}
+        
+        # Rank each contact's interactions newest first and keep the top N per contact
+        ranked = self.db.query(
+            Interaction.id.label("id"),
+            Interaction.contact_id.label("contact_id"),
+            func.row_number().over(
+                partition_by=Interaction.contact_id,
+                order_by=desc(Interaction.interaction_date)
+            ).label("recency_rank")
+        ).filter(
+            and_(
+                Interaction.user_id == user_id,
+                Interaction.contact_id.in_(contact_ids)
+            )
+        ).subquery()
+        
+        # The contact ID comes back as a plain column next to each entity, so grouping
+        # does not lazy-load it from interactions that only have the prompt columns
+        rows = self.db.query(Interaction, ranked.c.contact_id).join(
+            ranked, Interaction.id == ranked.c.id
+        ).filter(
+            ranked.c.recency_rank <= (limit or self.INTERACTIONS_PER_CONTACT)
+        ).options(
+            load_only(*self.SUMMARY_INTERACTION_COLUMNS)
+        ).order_by(ranked.c.contact_id, desc(Interaction.interaction_date)).all()
+        
+        return {
+            str(contact_id): [interaction for interaction, _ in group]
+            for contact_id, group in groupby(rows, key=itemgetter(1))
+        }
+    
+    async def _gather_contact_data(
+        self,
+        contact: Contact,
+        user_id: UUID,
+        interactions: Optional[List[Interaction]] = None,
+        now: Optional[datetime] = None,
+        summary_type: Optional[str] = None,
+        threads: Optional[List[Any]] = None
+    ) -> Dict[str, Any]:
+        """Gather all relevant data for an already validated contact."""
         try:
-            # Get contact details
-            contact = self.db.query(Contact).filter(
-                and_(Contact.id == contact_id, Contact.user_id == user_id)
-            ).first()
-            
-            # Get recent interactions
-            interactions = self.db.query(Interaction).filter(
-                and_(
-                    Interaction.contact_id == contact_id,
-                    Interaction.user_id == user_id
-                )
-            ).order_by(desc(Interaction.interaction_date)).limit(20).all()
+            now = now or datetime.utcnow()
             
-            # Get conversation threads from threading service
-            threads = await self.threading_service.build_conversation_threads(
-                user_id=str(user_id),
-                contact_id=str(contact_id),
-                days_back=90
-            )
+            if interactions is None:
+                # Get recent interactions, loading only the columns used in prompts
+                interactions = self.db.query(Interaction).filter(
+                    and_(
+                        Interaction.contact_id == contact.id,
+                        Interaction.user_id == user_id
+                    )
+                ).options(
+                    load_only(*self.SUMMARY_INTERACTION_COLUMNS)
+                ).order_by(desc(Interaction.interaction_date)).limit(self._interaction_limit(summary_type)).all()
+            
+            # Get conversation threads from threading service, only when the prompt uses them
+            if threads is None:
+                threads = await self._fetch_contact_threads(contact, user_id, summary_type)
+            
+            contact_info = {
+                "id": str(contact.id),
+                "name": contact.full_name,
+                "email": contact.email,
+                "phone": contact.phone,
+                "company": contact.company,
+                "job_title": contact.job_title,
+                "source": contact.contact_source,
+                "relationship_strength": float(contact.relationship_strength) if contact.relationship_strength else 0.0,
+                "tags": contact.tags or [],
+                "notes": contact.notes,
+                "created_at": contact.created_at.isoformat() if contact.created_at else None,
+                "last_interaction_at": contact.last_interaction_at.isoformat() if contact.last_interaction_at else None
+            }
             
             # Compile data
             contact_data = {
-                "contact": {
-                    "id": str(contact.id),
-                    "name": contact.full_name,
-                    "email": contact.email,
-                    "phone": contact.phone,
-                    "company": contact.company,
-                    "job_title": contact.job_title,
-                    "source": contact.contact_source,
-                    "relationship_strength": float(contact.relationship_strength) if contact.relationship_strength else 0.0,
-                    "tags": contact.tags or [],
-                    "notes": contact.notes,
-                    "created_at": contact.created_at.isoformat() if contact.created_at else None,
-                    "last_interaction_at": contact.last_interaction_at.isoformat() if contact.last_interaction_at else None
-                },
+                "contact": contact_info,
+                # Serialized once here so every prompt for this contact reuses it
+                "contact_json": _json_dumps(contact_info),
                 "interactions": [
                     {
                         "id": str(interaction.id),
@@ -307,7 +676,7 @@ class ContactSummarizationService:
                     "last_interaction_date": interactions[0].interaction_date.isoformat() if interactions else None,
                     "relationship_strength": float(contact.relationship_strength) if contact.relationship_strength else 0.0,
                     "days_since_last_contact": (
-                        (datetime.utcnow() - interactions[0].interaction_date).days
+                        (now - interactions[0].interaction_date).days
                         if interactions else None
                     )
                 }
@@ -333,7 +702,7 @@ class ContactSummarizationService:
             # Use AI assistant service for generation
             response = await self.ai_service.generate_message(
                 message_type="contact_summary",
-                recipient_context=json.dumps(contact_data["contact"]),
+                recipient_context=contact_data["contact_json"],
                 message_context=prompt,
                 user_id=str(contact_data["contact"]["id"]),
                 tone="professional",
@@ -376,172 +745,197 @@ Total Interactions: {stats['interaction_count']}
 Last Contact: {stats.get('last_interaction_date', 'Unknown')}
 """
         
-        if summary_type == SummaryType.COMPREHENSIVE:
-            return f"""
-{base_context}
-
-Recent Interactions:
-{self._format_interactions(interactions[:10])}
-
-Conversation Threads:
-{self._format_threads(threads[:3])}
-
-Generate a comprehensive summary of this contact including:
-1. Professional background and current role
-2. Relationship history and key interactions
-3. Communication patterns and preferences
-4. Key topics of mutual interest
-5. Relationship strength assessment
-6. Recommended next steps
-
-Format as JSON with keys: summary, talking_points, insights
-"""
-        
-        elif summary_type == SummaryType.BRIEF:
-            return f"""
-{base_context}
-
-Recent Activity:
-{self._format_interactions(interactions[:5])}
-
-Generate a brief contact summary including:
-1. Who they are professionally
-2. Recent interaction highlights
-3. Current relationship status
-4. 2-3 key talking points
-
-Format as JSON with keys: summary, talking_points
-"""
-        
-        elif summary_type == SummaryType.PRE_MEETING:
-            return f"""
-{base_context}
-
-Meeting Context: {meeting_context or 'General meeting'}
-
-Recent Interactions:
-{self._format_interactions(interactions[:5])}
-
-Recent Conversations:
-{self._format_threads(threads[:2])}
-
-Generate a pre-meeting summary including:
-1. Key background information
-2. Recent conversation topics
-3. Potential talking points for the meeting
-4. Any follow-ups or commitments to address
-5. Meeting-specific preparation notes
-
-Format as JSON with keys: summary, talking_points, meeting_notes
-"""
-        
-        elif summary_type == SummaryType.RELATIONSHIP_STATUS:
-            return f"""
-{base_context}
-
-Communication History:
-{self._format_interactions(interactions)}
-
-Assess the relationship status including:
-1. Current relationship health (strong/moderate/weak/cold)
-2. Communication frequency trends
-3. Engagement level analysis
-4. Risk factors (going cold, decreased interaction)
-5. Recommended actions to maintain/strengthen relationship
-
-Format as JSON with keys: summary, insights, recommendations
-"""
-        
-        elif summary_type == SummaryType.UPDATES:
-            days_back = 30
-            return f"""
-{base_context}
-
-Recent Updates (Last {days_back} days):
-{self._format_interactions(interactions[:10])}
-
-Summarize what's new with this contact:
-1. Recent interactions and conversations
-2. Any changes in communication patterns
-3. New developments or topics discussed
-4. Action items or follow-ups needed
-
-Format as JSON with keys: summary, recent_changes, action_items
-"""
+        prompt_spec = self.PROMPT_TEMPLATES.get(summary_type)
+        if prompt_spec is None:
+            return f"{base_context}\n\nGenerate a professional summary of this contact."
         
-        return f"{base_context}\n\nGenerate a professional summary of this contact."
+        template, interaction_limit, thread_limit = prompt_spec
+        return template.format(
+            base_context=base_context,
+            interactions=self._format_interactions(interactions[:interaction_limit]),
+            threads=self._format_threads(threads[:thread_limit]),
+            meeting_context=meeting_context or 'General meeting'
+        )
     
     def _format_interactions(self, interactions: List[Dict[str, Any]]) -> str:
         """Format interactions for prompt inclusion."""
-        if not interactions:
-            return "No recent interactions found."
-        
-        formatted = []
-        for interaction in interactions:
-            formatted.append(
-                f"- {interaction['date'][:10]} ({interaction['type']}): {interaction['summary']}"
-            )
-        
-        return "\n".join(formatted)
+        return "\n".join(
+            f"- {interaction['date'][:10]} ({interaction['type']}): {interaction['summary']}"
+            for interaction in interactions
+        ) or "No recent interactions found."
     
     def _format_threads(self, threads: List[Dict[str, Any]]) -> str:
         """Format conversation threads for prompt inclusion."""
-        if not threads:
-            return "No recent conversation threads found."
-        
-        formatted = []
-        for thread in threads:
-            formatted.append(
-                f"- {thread['subject']} ({thread['message_count']} messages, last: {thread['last_message_date'][:10]})"
-            )
-        
-        return "\n".join(formatted)
+        return "\n".join(
+            f"- {thread['subject']} ({thread['message_count']} messages, last: {thread['last_message_date'][:10]})"
+            for thread in threads
+        ) or "No recent conversation threads found."
     
     def _parse_summary_response(self, response: str, summary_type: str) -> Dict[str, Any]:
         """Parse AI response into structured format."""
-        try:
-            # Try to parse as JSON first
-            parsed = json.loads(response)
-            return parsed
-        except json.JSONDecodeError:
-            # Fallback to plain text parsing
-            return {
-                "summary": response,
-                "talking_points": [],
-                "insights": {}
-            }
+        # Strip markdown fences and only attempt a parse when the text looks like a JSON object
+        cleaned = _JSON_FENCE.sub("", response).strip()
+        if cleaned.startswith("{"):
+            try:
+                return _json_loads(cleaned)
+            except json.JSONDecodeError:
+                pass
+        
+        # Fallback to plain text parsing
+        return {
+            "summary": response,
+            "talking_points": [],
+            "insights": {}
+        }
     
     async def _get_cached_summary(
         self,
         contact_id: UUID,
         user_id: UUID,
         summary_type: str,
-        max_age_hours: Optional[int] = None
+        max_age_hours: Optional[int] = None,
+        content_hash: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get cached summary if available."""
-        # This would integrate with Redis cache
-        # For now, return None to always generate fresh
-        return None
+        """
+        Get cached summary if available, checking process memory before Redis.
+        
+        Entries older than max_age_hours, or built from a different contact
+        state than content_hash, are treated as misses.
+        """
+        cache_key = self._generate_cache_key(contact_id, user_id, summary_type)
+        
+        try:
+            entry = self.local_cache.get(cache_key)
+            if entry is None:
+                if not self.redis_client:
+                    return None
+                
+                # The Redis client is synchronous; keep its I/O off the event loop
+                cached_data = await asyncio.to_thread(self.redis_client.get, cache_key)
+                if not cached_data:
+                    return None
+                
+                entry = _json_loads(cached_data)
+                self.local_cache.set(cache_key, entry, self._local_cache_ttl(summary_type))
+            
+            if content_hash and entry.get("content_hash") != content_hash:
+                return None
+            
+            # Entries are shared by every service instance in the process; hand out a private copy
+            summary = copy.deepcopy(entry["summary"])
+            if max_age_hours is not None:
+                generated_at = datetime.fromisoformat(summary["generated_at"])
+                if datetime.utcnow() - generated_at > timedelta(hours=max_age_hours):
+                    return None
+            
+            summary["cached"] = True
+            return summary
+        except Exception as e:
+            logger.warning(f"Failed to get cached summary for contact {contact_id}: {e}")
+            return None
     
     async def _cache_summary(
         self,
         contact_id: UUID,
         user_id: UUID,
         summary_type: str,
-        summary: Dict[str, Any]
+        summary: Dict[str, Any],
+        content_hash: Optional[str] = None
     ) -> bool:
-        """Cache the generated summary."""
-        # This would store in Redis cache
-        # For now, just log the caching attempt
-        logger.info(f"Caching summary for contact {contact_id}, type {summary_type}")
-        return True
+        """Cache the generated summary in process memory and in Redis."""
+        cache_key = self._generate_cache_key(contact_id, user_id, summary_type)
+        entry = {"content_hash": content_hash, "summary": copy.deepcopy(summary)}
+        
+        self.local_cache.set(cache_key, entry, self._local_cache_ttl(summary_type))
+        
+        if not self.redis_client:
+            return False
+        
+        try:
+            await asyncio.to_thread(
+                self.redis_client.setex,
+                cache_key,
+                self.cache_duration_hours[summary_type] * 3600,
+                _json_dumps(entry)
+            )
+            logger.info(f"Cached summary for contact {contact_id}, type {summary_type}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to cache summary for contact {contact_id}: {e}")
+            return False
     
     async def _invalidate_cached_summaries(self, contact_id: UUID, user_id: UUID) -> bool:
         """Invalidate all cached summaries for a contact."""
-        # This would clear Redis cache entries
-        logger.info(f"Invalidating cached summaries for contact {contact_id}")
-        return True
+        cache_keys = [
+            self._generate_cache_key(contact_id, user_id, summary_type)
+            for summary_type in self.cache_duration_hours
+        ]
+        self.local_cache.delete(*cache_keys)
+        
+        if not self.redis_client:
+            return False
+        
+        try:
+            await asyncio.to_thread(self.redis_client.delete, *cache_keys)
+            logger.info(f"Invalidated cached summaries for contact {contact_id}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cached summaries for contact {contact_id}: {e}")
+            return False
+    
+    async def _invalidate_stale_summaries(
+        self,
+        contact_id: UUID,
+        user_id: UUID,
+        content_hash: str
+    ) -> int:
+        """Invalidate cached summaries whose content hash differs from the contact's current state."""
+        cache_keys = [
+            self._generate_cache_key(contact_id, user_id, summary_type)
+            for summary_type in self.cache_duration_hours
+        ]
+        
+        redis_entries = [None] * len(cache_keys)
+        if self.redis_client:
+            try:
+                redis_entries = await asyncio.to_thread(self.redis_client.mget, cache_keys)
+            except Exception as e:
+                logger.warning(f"Failed to read cached summaries for contact {contact_id}: {e}")
+        
+        stale_keys = []
+        for cache_key, cached_data in zip(cache_keys, redis_entries):
+            entry = self.local_cache.get(cache_key)
+            if entry is None and cached_data:
+                entry = _json_loads(cached_data)
+            if entry is not None and entry.get("content_hash") != content_hash:
+                stale_keys.append(cache_key)
+        
+        if not stale_keys:
+            return 0
+        
+        self.local_cache.delete(*stale_keys)
+        
+        if self.redis_client:
+            try:
+                await asyncio.to_thread(self.redis_client.delete, *stale_keys)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate cached summaries for contact {contact_id}: {e}")
+        
+        return len(stale_keys)
+    
+    def _interaction_limit(self, summary_type: Optional[str]) -> int:
+        """Number of recent interactions to fetch for a summary type."""
+        return self.INTERACTION_LIMIT.get(summary_type, self.INTERACTIONS_PER_CONTACT)
+    
+    def _local_cache_ttl(self, summary_type: str) -> int:
+        """TTL for the in-process cache, never longer than the summary type's cache duration."""
+        return min(self.LOCAL_CACHE_TTL_SECONDS, self.cache_duration_hours[summary_type] * 3600)
+    
+    def _compute_content_hash(self, contact: Contact) -> str:
+        """Fingerprint the contact state a summary is built from."""
+        state = f"{contact.updated_at}|{contact.last_interaction_at}|{contact.relationship_strength}"
+        return hashlib.sha256(state.encode()).hexdigest()
     
     def _generate_cache_key(self, contact_id: UUID, user_id: UUID, summary_type: str) -> str:
         """Generate cache key for summary storage."""
-        return f"contact_summary:{user_id}:{contact_id}:{summary_type}" 
\ No newline at end of file
+        return self.CACHE_KEY_PREFIX + str(user_id) + ":" + str(contact_id) + ":" + summary_type
\ No newline at end of file
@@ -14,27 +14,123 @@ Key Features:
 """
 
 import asyncio
+import hashlib
+import heapq
+import json
 import logging
+import math
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Set
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Set
+from dataclasses import dataclass, field
 from collections import defaultdict, Counter
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, asc
 from uuid import UUID, uuid4
 import re
 from difflib import SequenceMatcher
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from models.orm.interaction import Interaction
 from models.orm.contact import Contact
 from models.orm.user import User
+from config import settings
+from lib.cache import TTLCache, get_redis_client
 from services.ai_assistant import AIAssistantService
-from lib.llm_client import LLMUsageType
+from lib.llm_client import LLMUsageType, OpenAIModel
 
 logger = logging.getLogger(__name__)
 
+# Reply/forward prefixes and whitespace runs in email subjects
+_SUBJECT_PREFIX_RE = re.compile(r'^(re|fwd|fw):\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Subject words of 3+ characters, and generic words never reported as themes
+_THEME_WORD_RE = re.compile(r'\b\w{3,}\b')
+_COMMON_THEME_WORDS = frozenset({'meeting', 'call', 'project', 'team', 'update', 'follow', 'discussion'})
+
+# Subject keywords marking an email as a meeting follow-up
+_FOLLOWUP_KEYWORDS_RE = re.compile(
+    r'follow|recap|summary|action|next steps|thank you|thanks for|meeting|discussed'
+)
+
+# Interaction dict fields listed for each recent interaction in a summary prompt
+_SUMMARY_INTERACTION_FIELDS = itemgetter('interaction_date', 'interaction_type', 'subject')
+
+# "### 3:" markers separating per-thread answers in a batched summary response
+_SUMMARY_SECTION_RE = re.compile(r'^\s*###\s*(\d+)\s*:', re.MULTILINE)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_subject(subject: str) -> str:
+    """
+    Lowercase a subject and strip its Re:/Fwd: prefix and extra whitespace
+    
+    Memoized because every subject is normalized once per merge strategy and
+    again for theme extraction, and replies repeat the same subject text.
+    """
+    normalized = _SUBJECT_PREFIX_RE.sub('', subject.lower().strip())
+    return _WHITESPACE_RE.sub(' ', normalized)
+
+
+def _thread_recency_key(thread: 'ConversationThread') -> Tuple[float, float]:
+    """Order threads by last activity, then context score"""
+    return thread.end_date.timestamp(), thread.context_score
+
+
+class _ThreadUnionFind:
+    """Disjoint-set union over thread IDs with path compression"""
+    
+    def __init__(self, thread_ids: Iterable[str]):
+        self.parent = {thread_id: thread_id for thread_id in thread_ids}
+    
+    def find(self, thread_id: str) -> str:
+        root = thread_id
+        while self.parent[root] != root:
+            root = self.parent[root]
+        
+        # Point every visited node straight at the root
+        while self.parent[thread_id] != root:
+            self.parent[thread_id], thread_id = root, self.parent[thread_id]
+        
+        return root
+    
+    def union(self, thread_id_a: str, thread_id_b: str) -> None:
+        root_a = self.find(thread_id_a)
+        root_b = self.find(thread_id_b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+def _interval_cv(dates: List[datetime]) -> Optional[float]:
+    """
+    Coefficient of variation of the gaps between consecutive dates
+    
+    Returns None when there are no gaps or the mean gap is not positive.
+    """
+    intervals = [(later - earlier).total_seconds() for earlier, later in zip(dates, dates[1:])]
+    if not intervals:
+        return None
+    
+    mean_interval = math.fsum(intervals) / len(intervals)
+    if mean_interval <= 0:
+        return None
+    
+    if len(intervals) == 1:
+        return 0.0
+    
+    variance = math.fsum((interval - mean_interval) ** 2 for interval in intervals) / (len(intervals) - 1)
+    return math.sqrt(variance) / mean_interval
+
 
-@dataclass
+@dataclass(slots=True)
 class ConversationThread:
     """Unified conversation thread across platforms"""
     thread_id: str
@@ -52,9 +148,13 @@ class ConversationThread:
     thread_type: str  # 'ongoing', 'completed', 'dormant', 'sporadic'
     context_score: float  # How well-connected the interactions are
     thread_summary: Optional[str] = None
+    _theme_set: Set[str] = field(init=False, repr=False, compare=False)  # subject_themes as a set
+    
+    def __post_init__(self):
+        self._theme_set = set(self.subject_themes)
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadMergeCandidate:
     """Candidate for thread merging"""
     thread_a: ConversationThread
@@ -65,7 +165,7 @@ class ThreadMergeCandidate:
     recommended_action: str  # 'auto_merge', 'manual_review', 'separate'
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationContext:
     """Context information linking interactions"""
     interaction_id: str
@@ -75,6 +175,35 @@ class ConversationContext:
     evidence: Dict[str, Any]
 
 
+def _thread_summary_key(thread: ConversationThread) -> str:
+    """
+    Cache key for a thread's summary
+    
+    Thread IDs change on every rebuild, so the key is the user, contact and
+    first interaction of the thread instead.
+    """
+    first_id = thread.interactions[0]['id'] if thread.interactions else ''
+    return f"thread_summary:{thread.user_id}:{thread.contact_id}:{first_id}"
+
+
+def _thread_fingerprint(thread: ConversationThread) -> str:
+    """Digest of everything a thread's summary prompt is built from"""
+    return hashlib.sha1(repr((
+        thread.total_interactions,
+        thread.end_date.isoformat(),
+        thread.thread_type,
+        sorted(thread.subject_themes),
+        [interaction['id'] for interaction in thread.interactions[-5:]]
+    )).encode()).hexdigest()
+
+
+# Process-wide thread summary cache shared across requests
+thread_summary_cache = TTLCache(maxsize=2048)
+
+# Summary refreshes queued by this process and not yet due, keyed like the Redis dedupe keys
+pending_summary_refreshes = TTLCache(maxsize=4096)
+
+
 class ConversationThreadingService:
     """
     Service for cross-platform conversation threading and context linking
@@ -86,6 +215,20 @@ class ConversationThreadingService:
     PARTICIPANT_OVERLAP_THRESHOLD = 0.5  # Minimum participant overlap for merging
     AUTO_MERGE_CONFIDENCE_THRESHOLD = 0.8  # Confidence threshold for auto-merge
     MANUAL_REVIEW_CONFIDENCE_THRESHOLD = 0.6  # Confidence threshold for manual review
+    FETCH_BATCH_SIZE = 1000  # Interaction rows fetched per round trip
+    SUMMARY_CACHE_TTL_SECONDS = 3600  # Lifetime of a cached thread summary
+    SUMMARY_REFRESH_DELAY_SECONDS = 60  # Refresh requests within this window share one queued task
+    SUMMARY_REUSE_MAX_NEW_INTERACTIONS = 1  # New interactions tolerated before re-summarizing
+    SUMMARY_BATCH_SIZE = 8  # Threads summarized per batched LLM request
+    SUMMARY_MIN_INTERACTIONS = 3  # Smaller threads get the template summary without an LLM call
+    SUMMARY_SHORT_THREAD_INTERACTIONS = 10  # Threads below this size get SUMMARY_SHORT_MAX_TOKENS
+    SUMMARY_SHORT_MAX_TOKENS = 80
+    SUMMARY_MAX_TOKENS = 150
+    SUMMARY_MIN_LENGTH = 40  # Shorter summaries are escalated to SUMMARY_ESCALATION_MODEL
+    
+    # Summaries try the cheap model first and escalate only when its answer fails the quality gate
+    SUMMARY_MODEL = OpenAIModel.GPT_3_5_TURBO
+    SUMMARY_ESCALATION_MODEL = OpenAIModel.GPT_4_TURBO
     
     # Platform priorities for dominant platform determination
     PLATFORM_PRIORITIES = {
@@ -96,6 +239,33 @@ class ConversationThreadingService:
         'manual': 1
     }
     
+    # Thread type priorities when merging threads of different types
+    THREAD_TYPE_PRIORITIES = {
+        'ongoing': 4,
+        'completed': 3,
+        'sporadic': 2,
+        'dormant': 1
+    }
+    
+    # Summary instructions go in the system message, ahead of any thread data, so
+    # the provider can reuse its cached prompt prefix across calls
+    SUMMARY_SYSTEM_MESSAGE = (
+        "You summarize professional conversation threads in 2-3 sentences. "
+        "Focus on the relationship progression and key outcomes."
+    )
+    BATCH_SUMMARY_SYSTEM_MESSAGE = SUMMARY_SYSTEM_MESSAGE + (
+        " You are given several numbered threads. Answer with one summary per thread, "
+        "each prefixed \"### <number>:\" matching its thread."
+    )
+    
+    # Platform transitions between threads that suggest one conversation
+    NATURAL_PLATFORM_TRANSITIONS = frozenset({
+        ('email', 'meeting'),
+        ('meeting', 'email'),
+        ('email', 'calendar'),
+        ('calendar', 'email')
+    })
+    
     def __init__(self, db: Session):
         """
         Initialize conversation threading service
@@ -105,6 +275,15 @@ class ConversationThreadingService:
         """
         self.db = db
         self.ai_assistant = AIAssistantService(db)
+        self._temporal_window = timedelta(hours=self.TEMPORAL_WINDOW_HOURS)
+        self._summary_cache = thread_summary_cache
+        
+        # Redis copy of thread summaries, shared with the background workers that pre-generate them
+        try:
+            self._summary_redis = get_redis_client()
+        except Exception as e:
+            logger.warning(f"Thread summary cache limited to process memory: {e}")
+            self._summary_redis = None
         
     async def build_conversation_threads(
         self,
@@ -112,7 +291,9 @@ class ConversationThreadingService:
         contact_id: Optional[str] = None,
         days_back: int = 90,
         include_platforms: Optional[List[str]] = None,
-        force_rebuild: bool = False
+        force_rebuild: bool = False,
+        include_summaries: bool = False,
+        limit: Optional[int] = None
     ) -> List[ConversationThread]:
         """
         Build unified conversation threads for a user or specific contact
@@ -123,6 +304,8 @@ class ConversationThreadingService:
             days_back: Number of days back to analyze
             include_platforms: Optional list of platforms to include
             force_rebuild: Force rebuild of all threads
+            include_summaries: Fill in thread summaries with batched LLM requests
+            limit: Optional maximum number of threads to return
             
         Returns:
             List of conversation threads
@@ -138,30 +321,29 @@ class ConversationThreadingService:
                 include_platforms=include_platforms
             )
             
-            if not interactions:
-                return []
-            
-            # Group interactions by contact
-            contact_interactions = defaultdict(list)
-            for interaction in interactions:
-                contact_interactions[str(interaction.contact_id)].append(interaction)
-            
-            # Build threads for each contact
+            # Build threads for each contact as rows stream in, ordered by contact, then date
             all_threads = []
-            for contact_id, contact_ints in contact_interactions.items():
-                threads = await self._build_contact_threads(contact_id, contact_ints)
+            for contact_id, contact_ints in groupby(interactions, key=lambda interaction: str(interaction.contact_id)):
+                threads = self._build_contact_threads(contact_id, list(contact_ints))
                 all_threads.extend(threads)
             
+            if not all_threads:
+                return []
+            
             # Find and process thread merge candidates
-            merge_candidates = await self._find_thread_merge_candidates(all_threads)
-            merged_threads = await self._process_thread_merges(all_threads, merge_candidates)
+            merge_candidates = self._find_thread_merge_candidates(all_threads)
+            merged_threads = self._process_thread_merges(all_threads, merge_candidates)
             
-            # Sort threads by recency and importance
-            sorted_threads = sorted(
-                merged_threads,
-                key=lambda t: (t.end_date, t.context_score),
-                reverse=True
-            )
+            # Sort threads by recency and importance; select only the top threads when limited
+            if limit is not None:
+                sorted_threads = heapq.nlargest(limit, merged_threads, key=_thread_recency_key)
+            else:
+                sorted_threads = sorted(merged_threads, key=_thread_recency_key, reverse=True)
+            
+            if include_summaries:
+                summaries = await self.generate_thread_summaries_batch(sorted_threads)
+                for thread, summary in zip(sorted_threads, summaries):
+                    thread.thread_summary = summary
             
             logger.info(f"Built {len(sorted_threads)} conversation threads")
             return sorted_threads
@@ -176,7 +358,7 @@ class ConversationThreadingService:
         contact_id: Optional[str] = None,
         days_back: int = 90,
         include_platforms: Optional[List[str]] = None
-    ) -> List[Interaction]:
+    ) -> Iterable[Interaction]:
         """
         Fetch interactions from database with filtering
         
@@ -187,7 +369,7 @@ class ConversationThreadingService:
             include_platforms: Optional platform filter
             
         Returns:
-            List of interactions
+            Interactions ordered by contact, then date, streamed in batches
         """
         # Build query
         query = self.db.query(Interaction).filter(
@@ -198,20 +380,24 @@ class ConversationThreadingService:
         if contact_id:
             query = query.filter(Interaction.contact_id == contact_id)
         
-        # Add date filter
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # Add date filter, snapped to the hour so the bound is stable across requests
+        # within the hour (served by an index on (user_id, contact_id, interaction_date))
+        cutoff_date = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) - timedelta(days=days_back)
         query = query.filter(Interaction.interaction_date >= cutoff_date)
         
         # Add platform filter
         if include_platforms:
             query = query.filter(Interaction.source_platform.in_(include_platforms))
         
-        # Order by date
-        query = query.order_by(Interaction.interaction_date.asc())
+        # Order by contact, then date, so callers can group contacts in a single pass
+        query = query.order_by(Interaction.contact_id.asc(), Interaction.interaction_date.asc())
         
-        return query.all()
+        # Stream rows in batches instead of materializing every interaction up front
+        return query.yield_per(self.FETCH_BATCH_SIZE)
     
-    async def _build_contact_threads(
+    def _build_contact_threads(
         self,
         contact_id: str,
         interactions: List[Interaction]
@@ -221,7 +407,7 @@ class ConversationThreadingService:
         
         Args:
             contact_id: Contact ID
-            interactions: List of interactions with the contact
+            interactions: List of interactions with the contact, sorted in place by date
             
         Returns:
             List of conversation threads
@@ -229,16 +415,16 @@ class ConversationThreadingService:
         if not interactions:
             return []
         
-        # Sort interactions by date
-        sorted_interactions = sorted(interactions, key=lambda x: x.interaction_date)
+        # Sort interactions by date once; thread groups and threads keep this order
+        interactions.sort(key=attrgetter('interaction_date'))
         
         # Group interactions into threads using multiple strategies
-        thread_groups = await self._group_interactions_into_threads(sorted_interactions)
+        thread_groups = self._group_interactions_into_threads(interactions)
         
         # Convert groups to ConversationThread objects
         threads = []
         for i, group in enumerate(thread_groups):
-            thread = await self._create_conversation_thread(
+            thread = self._create_conversation_thread(
                 thread_id=f"{contact_id}_thread_{i}",
                 contact_id=contact_id,
                 interactions=group
@@ -247,7 +433,7 @@ class ConversationThreadingService:
         
         return threads
     
-    async def _group_interactions_into_threads(
+    def _group_interactions_into_threads(
         self,
         interactions: List[Interaction]
     ) -> List[List[Interaction]]:
@@ -271,7 +457,7 @@ class ConversationThreadingService:
             prev_interaction = interactions[i-1]
             
             # Check if this interaction should be in the same thread
-            should_merge = await self._should_merge_into_thread(
+            should_merge = self._should_merge_into_thread(
                 current_interaction, prev_interaction, current_thread
             )
             
@@ -287,7 +473,7 @@ class ConversationThreadingService:
         
         return thread_groups
     
-    async def _should_merge_into_thread(
+    def _should_merge_into_thread(
         self,
         current_interaction: Interaction,
         prev_interaction: Interaction,
@@ -304,37 +490,57 @@ class ConversationThreadingService:
         Returns:
             True if should merge
         """
-        # Strategy 1: Temporal proximity
-        time_diff = current_interaction.interaction_date - prev_interaction.interaction_date
-        if time_diff <= timedelta(hours=self.TEMPORAL_WINDOW_HOURS):
-            return True
+        # Strategies are ordered cheapest first; any match merges
         
-        # Strategy 2: Subject similarity (for emails)
-        if (current_interaction.subject and prev_interaction.subject and
-            current_interaction.interaction_type == 'email' and 
-            prev_interaction.interaction_type == 'email'):
+        # Strategy 1: External ID linking (for email threads)
+        if (current_interaction.source_platform == 'gmail' and prev_interaction.source_platform == 'gmail' and
+            current_interaction.platform_metadata and prev_interaction.platform_metadata):
             
-            similarity = self._calculate_subject_similarity(
-                current_interaction.subject, prev_interaction.subject
-            )
-            if similarity >= self.SUBJECT_SIMILARITY_THRESHOLD:
+            curr_thread_id = current_interaction.platform_metadata.get('thread_id')
+            if curr_thread_id and curr_thread_id == prev_interaction.platform_metadata.get('thread_id'):
                 return True
         
-        # Strategy 3: Meeting follow-up pattern
-        if await self._is_meeting_followup_pattern(current_interaction, current_thread):
+        # Strategy 2: Temporal proximity
+        time_diff = current_interaction.interaction_date - prev_interaction.interaction_date
+        if time_diff <= self._temporal_window:
             return True
         
-        # Strategy 4: External ID linking (for email threads)
-        if (current_interaction.platform_metadata and prev_interaction.platform_metadata and
-            current_interaction.source_platform == 'gmail' and prev_interaction.source_platform == 'gmail'):
+        # Strategy 3: Subject similarity (for emails)
+        if (current_interaction.interaction_type == 'email' and
+            prev_interaction.interaction_type == 'email' and
+            current_interaction.subject and prev_interaction.subject):
             
-            curr_thread_id = current_interaction.platform_metadata.get('thread_id')
-            prev_thread_id = prev_interaction.platform_metadata.get('thread_id')
-            if curr_thread_id and prev_thread_id and curr_thread_id == prev_thread_id:
+            if self._subjects_similar(current_interaction.subject, prev_interaction.subject):
                 return True
         
+        # Strategy 4: Meeting follow-up pattern, which scans the whole current thread
+        if self._is_meeting_followup_pattern(current_interaction, current_thread):
+            return True
+        
         return False
     
+    def _subjects_similar(self, subject1: str, subject2: str) -> bool:
+        """
+        Check whether two subjects reach SUBJECT_SIMILARITY_THRESHOLD
+        
+        Equivalent to comparing _calculate_subject_similarity against the
+        threshold, but identical subjects and clearly dissimilar ones are
+        decided without computing the full ratio.
+        """
+        norm1 = _normalize_subject(subject1)
+        norm2 = _normalize_subject(subject2)
+        if norm1 == norm2:
+            return True
+        
+        threshold = self.SUBJECT_SIMILARITY_THRESHOLD
+        # quick_ratio and real_quick_ratio are upper bounds of ratio, so they can only reject
+        matcher = SequenceMatcher(None, norm1, norm2)
+        return (
+            matcher.real_quick_ratio() >= threshold and
+            matcher.quick_ratio() >= threshold and
+            matcher.ratio() >= threshold
+        )
+    
     def _calculate_subject_similarity(self, subject1: str, subject2: str) -> float:
         """
         Calculate similarity between two subjects
@@ -346,20 +552,12 @@ class ConversationThreadingService:
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        # Normalize subjects
-        def normalize_subject(subject):
-            # Remove Re:, Fwd:, etc.
-            normalized = re.sub(r'^(re|fwd|fw):\s*', '', subject.lower().strip())
-            # Remove extra whitespace
-            normalized = re.sub(r'\s+', ' ', normalized)
-            return normalized
-        
-        norm1 = normalize_subject(subject1)
-        norm2 = normalize_subject(subject2)
+        norm1 = _normalize_subject(subject1)
+        norm2 = _normalize_subject(subject2)
         
         return SequenceMatcher(None, norm1, norm2).ratio()
     
-    async def _is_meeting_followup_pattern(
+    def _is_meeting_followup_pattern(
         self,
         current_interaction: Interaction,
         thread_interactions: List[Interaction]
@@ -374,26 +572,22 @@ class ConversationThreadingService:
         Returns:
             True if this appears to be a meeting follow-up
         """
+        # Only emails whose subject reads like a follow-up can qualify
+        if current_interaction.interaction_type != 'email' or not current_interaction.subject:
+            return False
+        if not _FOLLOWUP_KEYWORDS_RE.search(current_interaction.subject.lower()):
+            return False
+        
         # Look for meeting -> email pattern within 24 hours
         for thread_int in thread_interactions:
-            if thread_int.interaction_type in ['meeting', 'calendar']:
+            if thread_int.interaction_type in ('meeting', 'calendar'):
                 time_diff = current_interaction.interaction_date - thread_int.interaction_date
-                if (0 <= time_diff.total_seconds() <= 24 * 3600 and 
-                    current_interaction.interaction_type == 'email'):
-                    
-                    # Check for follow-up keywords in subject
-                    if current_interaction.subject:
-                        followup_keywords = [
-                            'follow', 'recap', 'summary', 'action', 'next steps',
-                            'thank you', 'thanks for', 'meeting', 'discussed'
-                        ]
-                        subject_lower = current_interaction.subject.lower()
-                        if any(keyword in subject_lower for keyword in followup_keywords):
-                            return True
+                if 0 <= time_diff.total_seconds() <= 24 * 3600:
+                    return True
         
         return False
     
-    async def _create_conversation_thread(
+    def _create_conversation_thread(
         self,
         thread_id: str,
         contact_id: str,
@@ -405,7 +599,7 @@ class ConversationThreadingService:
         Args:
             thread_id: Thread identifier
             contact_id: Contact ID
-            interactions: List of interactions in the thread
+            interactions: List of interactions in the thread, sorted by date
             
         Returns:
             ConversationThread object
@@ -413,27 +607,31 @@ class ConversationThreadingService:
         if not interactions:
             raise ValueError("Cannot create thread from empty interactions")
         
-        # Sort interactions by date
-        sorted_interactions = sorted(interactions, key=lambda x: x.interaction_date)
+        # Interactions arrive sorted by date; extract each column once and share
+        # it across the metric helpers
+        dates = list(map(attrgetter('interaction_date'), interactions))
+        directions = list(map(attrgetter('direction'), interactions))
+        subjects = list(map(attrgetter('subject'), interactions))
+        source_platforms = list(map(attrgetter('source_platform'), interactions))
         
         # Extract basic information
-        start_date = sorted_interactions[0].interaction_date
-        end_date = sorted_interactions[-1].interaction_date
-        platforms = set(int.source_platform for int in interactions if int.source_platform)
-        user_id = str(sorted_interactions[0].user_id)
+        start_date = interactions[0].interaction_date
+        end_date = interactions[-1].interaction_date
+        platforms = set(platform for platform in source_platforms if platform)
+        user_id = str(interactions[0].user_id)
         
         # Calculate thread metrics
         total_interactions = len(interactions)
-        thread_depth = self._calculate_thread_depth(interactions)
-        subject_themes = self._extract_subject_themes(interactions)
-        dominant_platform = self._determine_dominant_platform(interactions)
+        thread_depth = self._calculate_thread_depth(directions)
+        subject_themes = self._extract_subject_themes(subjects)
+        dominant_platform = self._determine_dominant_platform(source_platforms)
         participant_count = self._count_unique_participants(interactions)
-        thread_type = self._classify_thread_type(interactions)
-        context_score = await self._calculate_context_score(interactions)
+        thread_type = self._classify_thread_type(dates)
+        context_score = self._calculate_context_score(dates, directions, source_platforms)
         
         # Convert interactions to serializable format
         interaction_dicts = []
-        for interaction in sorted_interactions:
+        for interaction in interactions:
             interaction_dict = {
                 'id': str(interaction.id),
                 'interaction_type': interaction.interaction_type,
@@ -465,60 +663,52 @@ class ConversationThreadingService:
             context_score=context_score
         )
     
-    def _calculate_thread_depth(self, interactions: List[Interaction]) -> int:
+    def _calculate_thread_depth(self, directions: List[str]) -> int:
         """Calculate thread depth based on back-and-forth patterns"""
-        if len(interactions) <= 1:
+        if len(directions) <= 1:
             return 1
         
         depth = 1
-        last_direction = interactions[0].direction
+        last_direction = directions[0]
         
-        for interaction in interactions[1:]:
-            if interaction.direction != last_direction and interaction.direction != 'mutual':
+        for direction in directions[1:]:
+            if direction != last_direction and direction != 'mutual':
                 depth += 1
-            last_direction = interaction.direction
+            last_direction = direction
         
         return depth
     
-    def _extract_subject_themes(self, interactions: List[Interaction]) -> List[str]:
+    def _extract_subject_themes(self, subjects: List[Optional[str]]) -> List[str]:
         """Extract common themes from interaction subjects"""
-        subjects = [int.subject for int in interactions if int.subject]
+        subjects = [subject for subject in subjects if subject]
         if not subjects:
             return []
         
-        # Simple keyword extraction
-        all_words = []
-        for subject in subjects:
-            # Remove common prefixes and split into words
-            clean_subject = re.sub(r'^(re|fwd|fw):\s*', '', subject.lower())
-            words = re.findall(r'\b\w{3,}\b', clean_subject)
-            all_words.extend(words)
-        
-        # Count word frequency and return top themes
-        word_counts = Counter(all_words)
-        common_words = ['meeting', 'call', 'project', 'team', 'update', 'follow', 'discussion']
+        # Simple keyword extraction: strip common prefixes, then scan all subjects in one pass
+        text = ' '.join(map(_normalize_subject, subjects))
+        word_counts = Counter(_THEME_WORD_RE.findall(text))
         
-        themes = []
-        for word, count in word_counts.most_common(5):
-            if word not in common_words and count > 1:
-                themes.append(word)
+        # Return top themes
+        themes = [
+            word for word, count in word_counts.most_common(5)
+            if word not in _COMMON_THEME_WORDS and count > 1
+        ]
         
         return themes[:3]  # Return top 3 themes
     
-    def _determine_dominant_platform(self, interactions: List[Interaction]) -> str:
+    def _determine_dominant_platform(self, source_platforms: List[Optional[str]]) -> str:
         """Determine the dominant platform in the thread"""
-        platform_counts = Counter(int.source_platform for int in interactions if int.source_platform)
+        platform_counts = Counter(platform for platform in source_platforms if platform)
         
         if not platform_counts:
             return 'unknown'
         
-        # Weight by platform priority
-        weighted_scores = {}
-        for platform, count in platform_counts.items():
-            priority = self.PLATFORM_PRIORITIES.get(platform, 1)
-            weighted_scores[platform] = count * priority
-        
-        return max(weighted_scores.items(), key=lambda x: x[1])[0]
+        # Weight by platform priority; ties go to the platform seen first
+        priorities = self.PLATFORM_PRIORITIES
+        return max(
+            platform_counts.items(),
+            key=lambda item: item[1] * priorities.get(item[0], 1)
+        )[0]
     
     def _count_unique_participants(self, interactions: List[Interaction]) -> int:
         """Count unique participants across all interactions"""
@@ -533,21 +723,19 @@ class ConversationThreadingService:
         
         return len(participants)
     
-    def _classify_thread_type(self, interactions: List[Interaction]) -> str:
+    def _classify_thread_type(self, dates: List[datetime]) -> str:
         """Classify the thread type based on patterns"""
-        if not interactions:
+        if not dates:
             return 'unknown'
         
-        time_span = (interactions[-1].interaction_date - interactions[0].interaction_date).days
-        interaction_count = len(interactions)
+        time_span = (dates[-1] - dates[0]).days
+        interaction_count = len(dates)
         
-        # Recent activity (last 7 days)
-        recent_interactions = [
-            int for int in interactions 
-            if (datetime.now(timezone.utc) - int.interaction_date).days <= 7
-        ]
+        # Recent activity (last 7 days): (now - date).days <= 7 means less than 8 full days ago
+        recent_cutoff = datetime.now(timezone.utc) - timedelta(days=8)
+        has_recent = any(date > recent_cutoff for date in dates)
         
-        if recent_interactions:
+        if has_recent:
             return 'ongoing'
         elif time_span <= 1 and interaction_count >= 3:
             return 'completed'  # Intensive short conversation
@@ -556,40 +744,35 @@ class ConversationThreadingService:
         else:
             return 'dormant'
     
-    async def _calculate_context_score(self, interactions: List[Interaction]) -> float:
+    def _calculate_context_score(
+        self,
+        dates: List[datetime],
+        directions: List[str],
+        source_platforms: List[Optional[str]]
+    ) -> float:
         """Calculate how well-connected the interactions are contextually"""
-        if len(interactions) <= 1:
+        if len(dates) <= 1:
             return 0.5
         
         score = 0.0
         factors = 0
         
         # Factor 1: Temporal consistency
-        if len(interactions) >= 3:
-            intervals = []
-            for i in range(1, len(interactions)):
-                interval = (interactions[i].interaction_date - interactions[i-1].interaction_date).total_seconds()
-                intervals.append(interval)
-            
-            if intervals:
-                import statistics
-                mean_interval = statistics.mean(intervals)
-                if mean_interval > 0:
-                    std_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0
-                    cv = std_interval / mean_interval
-                    temporal_score = max(0, 1 - cv)
-                    score += temporal_score
-                    factors += 1
+        if len(dates) >= 3:
+            cv = _interval_cv(dates)
+            if cv is not None:
+                temporal_score = max(0, 1 - cv)
+                score += temporal_score
+                factors += 1
         
         # Factor 2: Bidirectional communication
-        directions = [int.direction for int in interactions]
         unique_directions = set(directions)
         if len(unique_directions) > 1:
             score += 0.8
         factors += 1
         
         # Factor 3: Platform consistency or logical progression
-        platforms = [int.source_platform for int in interactions if int.source_platform]
+        platforms = [platform for platform in source_platforms if platform]
         if len(set(platforms)) == 1:
             score += 0.6  # Consistent platform
         elif 'email' in platforms and 'meeting' in platforms:
@@ -598,7 +781,7 @@ class ConversationThreadingService:
         
         return score / factors if factors > 0 else 0.5
     
-    async def _find_thread_merge_candidates(
+    def _find_thread_merge_candidates(
         self,
         threads: List[ConversationThread]
     ) -> List[ThreadMergeCandidate]:
@@ -614,18 +797,61 @@ class ConversationThreadingService:
             if len(contact_thread_list) < 2:
                 continue
             
-            for i in range(len(contact_thread_list)):
-                for j in range(i + 1, len(contact_thread_list)):
-                    thread_a = contact_thread_list[i]
-                    thread_b = contact_thread_list[j]
-                    
-                    candidate = await self._evaluate_thread_merge(thread_a, thread_b)
-                    if candidate:
-                        candidates.append(candidate)
+            # Only evaluate pairs that can produce a candidate
+            for i, j in self._generate_merge_pairs(contact_thread_list):
+                candidate = self._evaluate_thread_merge(contact_thread_list[i], contact_thread_list[j])
+                if candidate:
+                    candidates.append(candidate)
         
         return candidates
     
-    async def _evaluate_thread_merge(
+    def _generate_merge_pairs(self, threads: List[ConversationThread]) -> List[Tuple[int, int]]:
+        """
+        Generate the index pairs of threads that share a merge signal
+        
+        A pair can only become a merge candidate if the threads are within the
+        temporal window, share a subject theme, or form a natural platform
+        transition, so other pairs are never evaluated.
+        
+        Args:
+            threads: Threads of a single contact
+            
+        Returns:
+            Sorted list of (i, j) index pairs with i < j
+        """
+        pairs = set()
+        window = timedelta(hours=self.TEMPORAL_WINDOW_HOURS)
+        
+        # Temporal proximity: sweep threads in start order until the gap exceeds the window
+        order = sorted(range(len(threads)), key=lambda idx: threads[idx].start_date)
+        for position, idx_a in enumerate(order):
+            latest_start = threads[idx_a].end_date + window
+            for idx_b in order[position + 1:]:
+                if threads[idx_b].start_date > latest_start:
+                    break
+                pairs.add((min(idx_a, idx_b), max(idx_a, idx_b)))
+        
+        # Shared subject themes and natural platform transitions via inverted indexes
+        theme_index = defaultdict(list)
+        platform_index = defaultdict(list)
+        for idx, thread in enumerate(threads):
+            for theme in thread._theme_set:
+                theme_index[theme].append(idx)
+            platform_index[thread.dominant_platform].append(idx)
+        
+        for indices in theme_index.values():
+            for position, idx_a in enumerate(indices):
+                for idx_b in indices[position + 1:]:
+                    pairs.add((idx_a, idx_b))
+        
+        for platform_a, platform_b in self.NATURAL_PLATFORM_TRANSITIONS:
+            for idx_a in platform_index.get(platform_a, []):
+                for idx_b in platform_index.get(platform_b, []):
+                    pairs.add((min(idx_a, idx_b), max(idx_a, idx_b)))
+        
+        return sorted(pairs)
+    
+    def _evaluate_thread_merge(
         self,
         thread_a: ConversationThread,
         thread_b: ConversationThread
@@ -650,7 +876,7 @@ class ConversationThreadingService:
         
         # Factor 2: Subject theme similarity
         if thread_a.subject_themes and thread_b.subject_themes:
-            common_themes = set(thread_a.subject_themes) & set(thread_b.subject_themes)
+            common_themes = thread_a._theme_set & thread_b._theme_set
             if common_themes:
                 theme_score = len(common_themes) / max(len(thread_a.subject_themes), len(thread_b.subject_themes))
                 confidence_factors.append(('subject_similarity', theme_score))
@@ -695,61 +921,56 @@ class ConversationThreadingService:
         thread_b: ConversationThread
     ) -> bool:
         """Check if platform transition between threads is natural"""
-        natural_transitions = [
-            ('email', 'meeting'),
-            ('meeting', 'email'),
-            ('email', 'calendar'),
-            ('calendar', 'email')
-        ]
-        
         transition = (thread_a.dominant_platform, thread_b.dominant_platform)
-        return transition in natural_transitions
+        return transition in self.NATURAL_PLATFORM_TRANSITIONS
     
-    async def _process_thread_merges(
+    def _process_thread_merges(
         self,
         threads: List[ConversationThread],
         candidates: List[ThreadMergeCandidate]
     ) -> List[ConversationThread]:
-        """Process thread merge candidates and return merged threads"""
-        # Sort candidates by confidence (highest first)
-        sorted_candidates = sorted(candidates, key=lambda c: c.merge_confidence, reverse=True)
+        """
+        Process thread merge candidates and return merged threads
         
-        # Track which threads have been merged
-        merged_thread_ids = set()
-        result_threads = []
+        Auto-merge candidates are unioned into connected components, so chains
+        of candidates (A-B, B-C) collapse into a single thread.
+        """
+        components = _ThreadUnionFind(thread.thread_id for thread in threads)
         
-        # Process auto-merge candidates
-        for candidate in sorted_candidates:
+        # Process auto-merge candidates, highest confidence first
+        for candidate in sorted(candidates, key=lambda c: c.merge_confidence, reverse=True):
             if candidate.recommended_action == 'auto_merge':
-                if (candidate.thread_a.thread_id not in merged_thread_ids and
-                    candidate.thread_b.thread_id not in merged_thread_ids):
-                    
-                    # Merge the threads
-                    merged_thread = await self._merge_threads(candidate.thread_a, candidate.thread_b)
-                    result_threads.append(merged_thread)
-                    
-                    # Mark as merged
-                    merged_thread_ids.add(candidate.thread_a.thread_id)
-                    merged_thread_ids.add(candidate.thread_b.thread_id)
-                    
-                    logger.info(f"Auto-merged threads {candidate.thread_a.thread_id} and {candidate.thread_b.thread_id}")
-        
-        # Add remaining unmerged threads
+                components.union(candidate.thread_a.thread_id, candidate.thread_b.thread_id)
+        
+        # Collect each component's threads in their original order
+        component_threads = defaultdict(list)
         for thread in threads:
-            if thread.thread_id not in merged_thread_ids:
-                result_threads.append(thread)
+            component_threads[components.find(thread.thread_id)].append(thread)
+        
+        result_threads = []
+        for members in component_threads.values():
+            if len(members) == 1:
+                result_threads.append(members[0])
+                continue
+            
+            # Merge the component into one thread, earliest thread first
+            members.sort(key=attrgetter('start_date'))
+            result_threads.append(self._merge_thread_group(members))
+            
+            logger.info(f"Auto-merged threads {', '.join(thread.thread_id for thread in members)}")
         
         return result_threads
     
-    async def _merge_threads(
+    def _merge_threads(
         self,
         thread_a: ConversationThread,
         thread_b: ConversationThread
     ) -> ConversationThread:
         """Merge two conversation threads"""
-        # Combine interactions and sort by date
-        all_interactions = thread_a.interactions + thread_b.interactions
-        sorted_interactions = sorted(all_interactions, key=lambda x: x['interaction_date'])
+        # Both threads are already in date order, so merge them in linear time
+        sorted_interactions = list(heapq.merge(
+            thread_a.interactions, thread_b.interactions, key=itemgetter('interaction_date')
+        ))
         
         # Create merged thread
         merged_thread = ConversationThread(
@@ -762,7 +983,7 @@ class ConversationThreadingService:
             end_date=max(thread_a.end_date, thread_b.end_date),
             total_interactions=thread_a.total_interactions + thread_b.total_interactions,
             thread_depth=max(thread_a.thread_depth, thread_b.thread_depth) + 1,
-            subject_themes=list(set(thread_a.subject_themes + thread_b.subject_themes)),
+            subject_themes=list(thread_a._theme_set | thread_b._theme_set),
             dominant_platform=self._choose_dominant_platform(thread_a, thread_b),
             participant_count=max(thread_a.participant_count, thread_b.participant_count),
             thread_type=self._merge_thread_types(thread_a.thread_type, thread_b.thread_type),
@@ -771,83 +992,396 @@ class ConversationThreadingService:
         
         return merged_thread
     
+    def _merge_thread_group(self, threads: List[ConversationThread]) -> ConversationThread:
+        """
+        Merge several threads into one in a single pass
+        
+        Gives the same thread as folding _merge_threads over the list from the
+        left, but merges all interaction lists in one k-way merge instead of
+        re-merging the growing list at every step.
+        """
+        if len(threads) == 2:
+            return self._merge_threads(*threads)
+        
+        # Fold the scalar fields in list order, so ties break as in pairwise merges
+        first = threads[0]
+        priorities = self.PLATFORM_PRIORITIES
+        dominant_platform = first.dominant_platform
+        total_interactions = first.total_interactions
+        thread_type = first.thread_type
+        thread_depth = first.thread_depth
+        context_score = first.context_score
+        for thread in threads[1:]:
+            if ((priorities.get(thread.dominant_platform, 1), thread.total_interactions) >
+                    (priorities.get(dominant_platform, 1), total_interactions)):
+                dominant_platform = thread.dominant_platform
+            total_interactions += thread.total_interactions
+            thread_type = self._merge_thread_types(thread_type, thread.thread_type)
+            thread_depth = max(thread_depth, thread.thread_depth) + 1
+            context_score = (context_score + thread.context_score) / 2
+        
+        return ConversationThread(
+            thread_id='_merged_'.join(thread.thread_id for thread in threads),
+            contact_id=first.contact_id,
+            user_id=first.user_id,
+            platforms=set().union(*(thread.platforms for thread in threads)),
+            interactions=list(heapq.merge(
+                *(thread.interactions for thread in threads), key=itemgetter('interaction_date')
+            )),
+            start_date=min(thread.start_date for thread in threads),
+            end_date=max(thread.end_date for thread in threads),
+            total_interactions=total_interactions,
+            thread_depth=thread_depth,
+            subject_themes=list(set().union(*(thread._theme_set for thread in threads))),
+            dominant_platform=dominant_platform,
+            participant_count=max(thread.participant_count for thread in threads),
+            thread_type=thread_type,
+            context_score=context_score
+        )
+    
     def _choose_dominant_platform(
         self,
         thread_a: ConversationThread,
         thread_b: ConversationThread
     ) -> str:
         """Choose dominant platform for merged thread"""
-        platform_a_priority = self.PLATFORM_PRIORITIES.get(thread_a.dominant_platform, 1)
-        platform_b_priority = self.PLATFORM_PRIORITIES.get(thread_b.dominant_platform, 1)
-        
-        if platform_a_priority > platform_b_priority:
-            return thread_a.dominant_platform
-        elif platform_b_priority > platform_a_priority:
-            return thread_b.dominant_platform
-        else:
-            return thread_a.dominant_platform if thread_a.total_interactions >= thread_b.total_interactions else thread_b.dominant_platform
+        # Higher platform priority wins, then more interactions, then thread_a
+        priorities = self.PLATFORM_PRIORITIES
+        rank_a = (priorities.get(thread_a.dominant_platform, 1), thread_a.total_interactions)
+        rank_b = (priorities.get(thread_b.dominant_platform, 1), thread_b.total_interactions)
+        return thread_a.dominant_platform if rank_a >= rank_b else thread_b.dominant_platform
     
     def _merge_thread_types(self, type_a: str, type_b: str) -> str:
         """Merge thread types with priority logic"""
-        type_priority = {
-            'ongoing': 4,
-            'completed': 3,
-            'sporadic': 2,
-            'dormant': 1
-        }
-        
-        priority_a = type_priority.get(type_a, 0)
-        priority_b = type_priority.get(type_b, 0)
-        
-        return type_a if priority_a >= priority_b else type_b
+        priorities = self.THREAD_TYPE_PRIORITIES
+        return type_a if priorities.get(type_a, 0) >= priorities.get(type_b, 0) else type_b
     
     async def generate_thread_summary(
         self,
         thread: ConversationThread
     ) -> str:
         """Generate AI-powered summary for a conversation thread"""
+        if self._is_trivial_thread(thread):
+            return self._fallback_summary(thread)
+        
+        cached_summary = await self._get_cached_summary(thread)
+        if cached_summary is not None:
+            return cached_summary
+        
         try:
-            # Prepare context for AI
-            context_parts = [
-                f"Conversation thread with {thread.total_interactions} interactions",
-                f"Platforms: {', '.join(thread.platforms)}",
-                f"Duration: {thread.start_date.date()} to {thread.end_date.date()}",
-                f"Thread type: {thread.thread_type}"
-            ]
-            
-            if thread.subject_themes:
-                context_parts.append(f"Main topics: {', '.join(thread.subject_themes)}")
+            summary = await self._request_thread_summary(thread, self.SUMMARY_MODEL)
+            if not self._is_acceptable_summary(thread, summary):
+                logger.info(
+                    f"Escalating summary of thread {thread.thread_id} to {self.SUMMARY_ESCALATION_MODEL.value}"
+                )
+                summary = await self._request_thread_summary(thread, self.SUMMARY_ESCALATION_MODEL)
             
-            # Extract key interaction details
-            interaction_summaries = []
-            for interaction in thread.interactions[-5:]:  # Last 5 interactions
-                summary = f"{interaction['interaction_date'][:10]} - {interaction['interaction_type']}"
-                if interaction['subject']:
-                    summary += f": {interaction['subject'][:50]}"
-                interaction_summaries.append(summary)
+            if not summary:
+                return self._fallback_summary(thread)
             
-            prompt = f"""
-            Summarize this conversation thread in 2-3 sentences:
+            await self._cache_summary(thread, summary)
+            return summary
             
-            Context: {' | '.join(context_parts)}
+        except Exception as e:
+            logger.error(f"Failed to generate thread summary: {e}")
+            return self._fallback_summary(thread)
+    
+    @classmethod
+    def schedule_summary_refresh(cls, user_id: str, contact_id: Optional[str] = None) -> bool:
+        """
+        Queue background regeneration of thread summaries
+        
+        Called when new interactions arrive, so summaries are cached before
+        anyone reads them instead of being generated inside the request. The
+        task runs SUMMARY_REFRESH_DELAY_SECONDS later, and further requests for
+        the same user and contact until then are absorbed by it, so a burst of
+        new interactions queues a single rebuild.
+        
+        Returns:
+            True if a task was queued, False if one was already pending or
+            queueing failed
+        """
+        key = f"thread_summary_refresh:{user_id}:{contact_id or '*'}"
+        if pending_summary_refreshes.get(key):
+            return False
+        pending_summary_refreshes.set(key, True, cls.SUMMARY_REFRESH_DELAY_SECONDS)
+        
+        # Redis carries the dedupe across worker processes
+        try:
+            redis_client = get_redis_client()
+        except Exception as e:
+            logger.warning(f"Summary refresh dedupe unavailable, Redis connection failed: {e}")
+            redis_client = None
+        
+        if redis_client is not None:
+            try:
+                if not redis_client.set(key, 1, nx=True, ex=cls.SUMMARY_REFRESH_DELAY_SECONDS):
+                    return False
+            except Exception as e:
+                logger.warning(f"Failed to record pending summary refresh for user {user_id}: {e}")
+                redis_client = None
+        
+        # Imported here so the service layer does not load the Celery app at import time
+        from workers.celery_app import celery_app
+        
+        try:
+            celery_app.send_task(
+                'workers.tasks.thread_summary_task',
+                kwargs={'user_id': user_id, 'contact_id': contact_id},
+                countdown=cls.SUMMARY_REFRESH_DELAY_SECONDS
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to schedule thread summary refresh for user {user_id}: {e}")
+            # Let the next request try again instead of waiting out the window
+            pending_summary_refreshes.delete(key)
+            if redis_client is not None:
+                try:
+                    redis_client.delete(key)
+                except Exception as e:
+                    logger.warning(f"Failed to clear pending summary refresh for user {user_id}: {e}")
+            return False
+    
+    @classmethod
+    async def schedule_summary_refresh_async(cls, user_id: str, contact_id: Optional[str] = None) -> bool:
+        """
+        Queue background regeneration of thread summaries from async code
+        
+        Runs schedule_summary_refresh in a worker thread, so its Redis calls and
+        broker publish cannot stall the event loop when either is slow.
+        """
+        return await asyncio.to_thread(cls.schedule_summary_refresh, user_id, contact_id)
+    
+    async def _get_cached_summary(self, thread: ConversationThread) -> Optional[str]:
+        """
+        Get a thread's cached summary, checking process memory before Redis
+        
+        A summary is reused while the thread is unchanged, or has grown by no
+        more than SUMMARY_REUSE_MAX_NEW_INTERACTIONS since it was summarized.
+        """
+        key = _thread_summary_key(thread)
+        fingerprint = _thread_fingerprint(thread)
+        
+        def is_current(entry: Optional[Dict[str, Any]]) -> bool:
+            if entry is None:
+                return False
+            new_interactions = thread.total_interactions - entry['interaction_count']
+            return (
+                entry['fingerprint'] == fingerprint or
+                0 < new_interactions <= self.SUMMARY_REUSE_MAX_NEW_INTERACTIONS
+            )
+        
+        entry = self._summary_cache.get(key)
+        if not is_current(entry) and self._summary_redis:
+            # A worker may have refreshed the summary since this process cached it
+            try:
+                # The Redis client is synchronous; keep its I/O off the event loop
+                cached_data = await asyncio.to_thread(self._summary_redis.get, key)
+                if cached_data:
+                    entry = orjson.loads(cached_data) if ORJSON_AVAILABLE else json.loads(cached_data)
+                    self._summary_cache.set(key, entry, self.SUMMARY_CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.warning(f"Failed to read cached summary for thread {thread.thread_id}: {e}")
+        
+        return entry['summary'] if is_current(entry) else None
+    
+    async def _cache_summary(self, thread: ConversationThread, summary: str) -> None:
+        """Cache a thread's summary in process memory and in Redis"""
+        key = _thread_summary_key(thread)
+        entry = {
+            'fingerprint': _thread_fingerprint(thread),
+            'interaction_count': thread.total_interactions,
+            'summary': summary
+        }
+        
+        self._summary_cache.set(key, entry, self.SUMMARY_CACHE_TTL_SECONDS)
+        
+        if not self._summary_redis:
+            return
+        
+        try:
+            cached_data = orjson.dumps(entry) if ORJSON_AVAILABLE else json.dumps(entry)
+            await asyncio.to_thread(self._summary_redis.setex, key, self.SUMMARY_CACHE_TTL_SECONDS, cached_data)
+        except Exception as e:
+            logger.warning(f"Failed to cache summary for thread {thread.thread_id}: {e}")
+    
+    async def _request_thread_summary(self, thread: ConversationThread, model: OpenAIModel) -> str:
+        """Ask one model for a single thread's summary"""
+        response = await self.ai_assistant.generate_with_cache(
+            prompt=self._build_summary_context(thread),
+            user_id=thread.user_id,
+            request_type='thread_summary',
+            usage_type=LLMUsageType.CONVERSATION_SUMMARY,
+            model=model,
+            system_message=self.SUMMARY_SYSTEM_MESSAGE,
+            temperature=0.0,  # Deterministic, so cached summaries stay valid
+            max_tokens=self._summary_max_tokens(thread)
+        )
+        return response.content.strip()
+    
+    def _is_acceptable_summary(self, thread: ConversationThread, summary: str) -> bool:
+        """Cheap quality gate: long enough and mentions one of the thread's platforms or topics"""
+        if len(summary) < self.SUMMARY_MIN_LENGTH:
+            return False
+        
+        lowered = summary.lower()
+        return any(term.lower() in lowered for term in (*thread.subject_themes, *thread.platforms))
+    
+    async def generate_thread_summaries(
+        self,
+        threads: List[ConversationThread],
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate summaries for many threads with one request each, run concurrently
+        
+        Args:
+            threads: Threads to summarize
+            max_concurrency: Requests in flight at once, THREAD_SUMMARY_CONCURRENCY by default
             
-            Recent interactions:
-            {chr(10).join(interaction_summaries)}
+        Returns:
+            One summary per thread, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.THREAD_SUMMARY_CONCURRENCY)
+        
+        async def summarize(thread: ConversationThread) -> str:
+            async with semaphore:
+                return await self.generate_thread_summary(thread)
+        
+        return list(await asyncio.gather(*(summarize(thread) for thread in threads)))
+    
+    async def generate_thread_summaries_batch(
+        self,
+        threads: List[ConversationThread],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate summaries for many threads, several threads per LLM request
+        
+        Args:
+            threads: Threads of one user to summarize
+            batch_size: Threads per request, SUMMARY_BATCH_SIZE by default
+            max_concurrency: Requests in flight at once, THREAD_SUMMARY_CONCURRENCY by default
             
-            Focus on the relationship progression and key outcomes.
-            """
+        Returns:
+            One summary per thread, in input order
+        """
+        batch_size = batch_size or self.SUMMARY_BATCH_SIZE
+        semaphore = asyncio.Semaphore(max_concurrency or settings.THREAD_SUMMARY_CONCURRENCY)
+        
+        async def summarize_batch(batch: List[ConversationThread]) -> List[Optional[str]]:
+            async with semaphore:
+                return await self._batch_summarize(batch)
+        
+        batches = await asyncio.gather(*(
+            summarize_batch(threads[start:start + batch_size])
+            for start in range(0, len(threads), batch_size)
+        ))
+        summaries = [summary for batch in batches for summary in batch]
+        
+        # Threads the batched responses did not cover get a request of their own
+        missing = [index for index, summary in enumerate(summaries) if summary is None]
+        if missing:
+            fallbacks = await self.generate_thread_summaries(
+                [threads[index] for index in missing], max_concurrency
+            )
+            for index, summary in zip(missing, fallbacks):
+                summaries[index] = summary
+        
+        return summaries
+    
+    async def _batch_summarize(
+        self,
+        threads: List[ConversationThread]
+    ) -> List[Optional[str]]:
+        """
+        Summarize several threads with a single LLM request
+        
+        Args:
+            threads: Threads of one user to summarize
             
+        Returns:
+            One summary per thread, in input order; trivial threads get the
+            fallback summary, cached summaries are reused, and threads missing
+            from the response or failing the quality gate get None
+        """
+        summaries: List[Optional[str]] = [
+            self._fallback_summary(thread) if self._is_trivial_thread(thread)
+            else await self._get_cached_summary(thread)
+            for thread in threads
+        ]
+        pending = [index for index, summary in enumerate(summaries) if summary is None]
+        if len(pending) < 2:
+            # Nothing to batch; a lone miss is left to the single-thread prompt
+            return summaries
+        
+        prompt = "\n\n".join(
+            f"### {number}:\n{self._build_summary_context(threads[index])}"
+            for number, index in enumerate(pending, 1)
+        )
+        
+        try:
             response = await self.ai_assistant.generate_with_cache(
                 prompt=prompt,
-                user_id=thread.user_id,
-                request_type='thread_summary',
-                usage_type=LLMUsageType.CONTENT_ANALYSIS,
-                temperature=0.5,
-                max_tokens=150
+                user_id=threads[0].user_id,
+                request_type='thread_summary_batch',
+                usage_type=LLMUsageType.CONVERSATION_SUMMARY,
+                model=self.SUMMARY_MODEL,
+                system_message=self.BATCH_SUMMARY_SYSTEM_MESSAGE,
+                temperature=0.0,
+                max_tokens=sum(self._summary_max_tokens(threads[index]) for index in pending)
             )
-            
-            return response.content.strip()
-            
+            sections = _SUMMARY_SECTION_RE.split(response.content)
+            for number, text in zip(sections[1::2], sections[2::2]):
+                number, text = int(number), text.strip()
+                if 1 <= number <= len(pending) and self._is_acceptable_summary(threads[pending[number - 1]], text):
+                    index = pending[number - 1]
+                    summaries[index] = text
+                    await self._cache_summary(threads[index], text)
         except Exception as e:
-            logger.error(f"Failed to generate thread summary: {e}")
-            return f"Conversation thread with {thread.total_interactions} interactions across {len(thread.platforms)} platforms" 
\ No newline at end of file
+            logger.error(f"Failed to generate batched thread summaries: {e}")
+        
+        return summaries
+    
+    def _build_summary_context(self, thread: ConversationThread) -> str:
+        """
+        Describe a thread and its latest interactions for a summary prompt
+        
+        Lines run from the slowest-changing facts to the latest interactions,
+        so successive prompts for a growing thread share the longest prefix.
+        """
+        lines = [
+            f"Platforms: {', '.join(thread.platforms)}",
+            f"Started: {thread.start_date.date()}",
+            f"Thread type: {thread.thread_type}"
+        ]
+        
+        if thread.subject_themes:
+            lines.append(f"Main topics: {', '.join(thread.subject_themes)}")
+        
+        lines.append(f"Interactions: {thread.total_interactions}, latest on {thread.end_date.date()}")
+        lines.append("Recent interactions:")
+        
+        # Extract key interaction details from the last 5 interactions, three fields per lookup
+        for date, interaction_type, subject in map(_SUMMARY_INTERACTION_FIELDS, thread.interactions[-5:]):
+            if subject:
+                lines.append(f"- {date[:10]} - {interaction_type}: {subject[:50]}")
+            else:
+                lines.append(f"- {date[:10]} - {interaction_type}")
+        
+        return "\n".join(lines)
+    
+    def _is_trivial_thread(self, thread: ConversationThread) -> bool:
+        """Whether a thread is too small or topicless to be worth an LLM summary"""
+        return thread.total_interactions < self.SUMMARY_MIN_INTERACTIONS or not thread.subject_themes
+    
+    def _summary_max_tokens(self, thread: ConversationThread) -> int:
+        """Token budget for a thread's summary, smaller for short threads"""
+        if thread.total_interactions < self.SUMMARY_SHORT_THREAD_INTERACTIONS:
+            return self.SUMMARY_SHORT_MAX_TOKENS
+        return self.SUMMARY_MAX_TOKENS
+    
+    def _fallback_summary(self, thread: ConversationThread) -> str:
+        """Plain summary used when the LLM cannot produce one"""
+        return f"Conversation thread with {thread.total_interactions} interactions across {len(thread.platforms)} platforms"
@@ -13,15 +13,20 @@ Key Features:
 """
 
 import asyncio
+import copy
 import logging
+from bisect import bisect_right
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Iterable
 from dataclasses import dataclass
 from collections import defaultdict, Counter
+from itertools import chain, pairwise
+from operator import itemgetter
 import re
 from urllib.parse import urlparse
 
 from sqlalchemy.orm import Session
+from lib.cache import TTLCache
 from lib.gmail_client import GmailClient
 from services.contact_scoring import ContactScoringService, ScoringWeights
 from services.integration_service import IntegrationService
@@ -31,7 +36,7 @@ from models.orm.integration import Integration
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailContactMetadata:
     """Metadata extracted from email headers without content"""
     email: str
@@ -43,7 +48,7 @@ class EmailContactMetadata:
     thread_count: int
     is_sender: bool
     is_recipient: bool
-    labels_seen: Set[str]
+    labels_seen: int  # Bitmask of EmailContactFilteringService.LABEL_BITS flags
     response_rate: float  # Percentage of messages that got replies
     avg_response_time_hours: Optional[float]
     has_professional_signature: bool
@@ -81,6 +86,13 @@ class EmailFilteringResult:
     statistics: Dict[str, Any]
 
 
+# Process-wide filtering result cache shared across requests
+filtering_result_cache = TTLCache(maxsize=256)
+
+# Latest filtering run per integration, tracked by completion rather than by use
+latest_filtering_runs = TTLCache(maxsize=256)
+
+
 class EmailContactFilteringService:
     """
     Service for filtering and validating email contacts using metadata-only analysis
@@ -93,10 +105,10 @@ class EmailContactFilteringService:
     }
     
     # Personal/consumer domain patterns
-    PERSONAL_DOMAINS = {
+    PERSONAL_DOMAINS = frozenset({
         'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
         'icloud.com', 'me.com', 'mac.com', 'live.com', 'msn.com'
-    }
+    })
     
     # Automated sender patterns
     AUTOMATION_PATTERNS = {
@@ -106,6 +118,35 @@ class EmailContactFilteringService:
         'unsubscribe', 'bounce', 'mailer-daemon', 'postmaster'
     }
     
+    # str.endswith accepts a tuple and tests every suffix in one call
+    _CORPORATE_TLDS = tuple(CORPORATE_DOMAINS)
+    
+    # Precompiled matchers: one alternation search replaces the per-pattern loop
+    _AUTOMATION_RE = re.compile('|'.join(map(re.escape, AUTOMATION_PATTERNS)))
+    _DISPLAY_NAME_RE = re.compile(r'^([^<]+)<[^>]+>$')
+    
+    RESULT_CACHE_TTL_SECONDS = 300  # Lifetime of a cached filtering run
+    TOP_DOMAINS_LIMIT = 5  # Domains reported in filtering statistics
+    
+    # Gmail system labels tracked per contact, as bit flags
+    LABEL_BITS = {
+        'SPAM': 1 << 0, 'TRASH': 1 << 1, 'INBOX': 1 << 2, 'SENT': 1 << 3,
+        'IMPORTANT': 1 << 4, 'STARRED': 1 << 5, 'UNREAD': 1 << 6, 'DRAFT': 1 << 7,
+        'CATEGORY_PERSONAL': 1 << 8, 'CATEGORY_SOCIAL': 1 << 9,
+        'CATEGORY_PROMOTIONS': 1 << 10, 'CATEGORY_UPDATES': 1 << 11,
+        'CATEGORY_FORUMS': 1 << 12
+    }
+    
+    # Labels that exclude a contact from filtering results
+    EXCLUDED_LABEL_MASK = LABEL_BITS['SPAM'] | LABEL_BITS['TRASH']
+    
+    # Quality score lower bounds and the tiers they map to, lowest first
+    QUALITY_TIER_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+    QUALITY_TIERS = (
+        'tier_5_minimal', 'tier_4_occasional', 'tier_3_regular',
+        'tier_2_important', 'tier_1_key'
+    )
+    
     # Professional signature indicators in headers
     PROFESSIONAL_INDICATORS = {
         'x-mailer', 'x-originating-ip', 'x-priority', 'importance',
@@ -148,6 +189,12 @@ class EmailContactFilteringService:
         """
         start_time = datetime.now()
         
+        cache_key = (integration_id, days_back, max_messages, min_message_count, require_two_way)
+        cached = filtering_result_cache.get(cache_key)
+        if cached is not None:
+            # Cached results are shared across requests, so hand out a copy
+            return copy.deepcopy(cached['result'])
+        
         try:
             # Get integration
             integration = await self.integration_service.get_integration(integration_id)
@@ -172,27 +219,17 @@ class EmailContactFilteringService:
                 integration, query, max_messages
             )
             
-            # Extract contact metadata from email headers
-            contact_metadata = await self._extract_contact_metadata(
-                sync_result.messages, integration.metadata.get('email_address', '')
-            )
-            
-            # Filter contacts based on quality criteria
-            filtered_contacts = await self._filter_contacts(
-                contact_metadata, min_message_count, require_two_way
-            )
-            
-            # Perform two-way validation
-            validated_contacts = await self._validate_two_way_communication(
-                filtered_contacts
-            )
-            
-            # Score contacts using existing scoring system
-            scored_contacts = await self._score_contacts(validated_contacts)
-            
-            # Generate statistics
-            statistics = self._generate_statistics(
-                contact_metadata, filtered_contacts, validated_contacts
+            # Analysis is pure CPU work; run it in a worker thread so large
+            # mailboxes do not block the event loop
+            (
+                contact_metadata, filtered_contacts, validated_contacts,
+                scored_contacts, statistics
+            ) = await asyncio.to_thread(
+                self._analyze_contacts,
+                sync_result.messages,
+                integration.metadata.get('email_address', ''),
+                min_message_count,
+                require_two_way
             )
             
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -200,16 +237,31 @@ class EmailContactFilteringService:
             result = EmailFilteringResult(
                 contacts_analyzed=len(contact_metadata),
                 contacts_extracted=len(filtered_contacts),
-                contacts_filtered=len([c for c in filtered_contacts if not c.is_automated]),
+                contacts_filtered=sum(not c.is_automated for c in filtered_contacts),
                 two_way_validated=len(validated_contacts),
-                professional_contacts=len([c for c in scored_contacts if c.get('is_professional', False)]),
-                automated_filtered=len([c for c in contact_metadata.values() if c.is_automated]),
-                spam_filtered=len([c for c in contact_metadata.values() if 'SPAM' in c.labels_seen]),
+                professional_contacts=sum(bool(c.get('is_professional', False)) for c in scored_contacts),
+                automated_filtered=statistics['automated_contacts_filtered'],
+                spam_filtered=statistics['spam_contacts_filtered'],
                 processing_time_seconds=processing_time,
                 contacts=scored_contacts,
                 statistics=statistics
             )
             
+            # Cache a private copy so callers can modify the result they get back
+            run = {
+                'result': copy.deepcopy(result),
+                'completed_at': datetime.now(timezone.utc),
+                'messages_analyzed': len(sync_result.messages),
+                'top_domains': [
+                    {'domain': domain, 'count': count}
+                    for domain, count in Counter(
+                        c.domain for c in filtered_contacts
+                    ).most_common(self.TOP_DOMAINS_LIMIT)
+                ]
+            }
+            filtering_result_cache.set(cache_key, run, self.RESULT_CACHE_TTL_SECONDS)
+            latest_filtering_runs.set(integration_id, run, self.RESULT_CACHE_TTL_SECONDS)
+            
             self.status_service.log_event(
                 integration_id=integration_id,
                 event_type='email_filtering_completed',
@@ -268,7 +320,54 @@ class EmailContactFilteringService:
             logger.error(f"Failed to fetch email metadata: {e}")
             raise
     
-    async def _extract_contact_metadata(
+    def _analyze_contacts(
+        self,
+        messages: List[Any],
+        user_email: str,
+        min_message_count: int,
+        require_two_way: bool
+    ) -> Tuple[
+        Dict[str, EmailContactMetadata],
+        List[EmailContactMetadata],
+        List[TwoWayValidationResult],
+        List[Dict[str, Any]],
+        Dict[str, Any]
+    ]:
+        """
+        Run the metadata analysis pipeline over fetched messages
+        
+        Args:
+            messages: List of email messages with metadata
+            user_email: User's email address to exclude from contacts
+            min_message_count: Minimum message count threshold
+            require_two_way: Whether to require bidirectional communication
+            
+        Returns:
+            Tuple of (contact metadata, filtered contacts, validated contacts,
+            scored contacts, statistics)
+        """
+        # Extract contact metadata from email headers
+        contact_metadata = self._extract_contact_metadata(messages, user_email)
+        
+        # Filter contacts based on quality criteria
+        filtered_contacts = self._filter_contacts(
+            contact_metadata, min_message_count, require_two_way
+        )
+        
+        # Perform two-way validation
+        validated_contacts = self._validate_two_way_communication(filtered_contacts)
+        
+        # Score contacts using existing scoring system
+        scored_contacts = self._score_contacts(validated_contacts)
+        
+        # Generate statistics
+        statistics = self._generate_statistics(
+            contact_metadata, filtered_contacts, validated_contacts
+        )
+        
+        return contact_metadata, filtered_contacts, validated_contacts, scored_contacts, statistics
+    
+    def _extract_contact_metadata(
         self,
         messages: List[Any],
         user_email: str
@@ -285,13 +384,14 @@ class EmailContactFilteringService:
         """
         contact_data = defaultdict(lambda: {
             'emails': set(),
-            'display_names': set(),
+            'display_name': '',
+            'has_automated_name': False,
             'first_seen': None,
             'last_seen': None,
             'messages_as_sender': 0,
             'messages_as_recipient': 0,
             'threads': set(),
-            'labels': set(),
+            'labels': 0,
             'response_times': [],
             'thread_depths': [],
             'communication_hours': [],
@@ -300,26 +400,40 @@ class EmailContactFilteringService:
         
         # Group messages by thread for response analysis
         threads = defaultdict(list)
+        user_email_lower = user_email.lower()
         
         for message in messages:
-            # Extract basic message info
+            # Extract basic message info once; it is shared by every participant
             message_date = message.date
+            message_hour = message_date.hour
             thread_id = message.thread_id
-            labels = set(message.labels)
+            sender_email = message.sender_email
+            label_bits = 0
+            for label in message.labels:
+                label_bits |= self.LABEL_BITS.get(label, 0)
+            recipients = message.recipients + message.cc + message.bcc
             
             threads[thread_id].append({
                 'id': message.id,
                 'date': message_date,
-                'sender': message.sender_email,
-                'recipients': message.recipients + message.cc + message.bcc,
-                'labels': labels
+                'sender': sender_email,
+                'recipients': recipients,
+                'labels': label_bits
             })
             
-            # Extract contacts from sender and recipients
-            all_contacts = [message.sender_email] + message.recipients + message.cc + message.bcc
+            # Extract display name from sender field
+            sender_field = getattr(message, 'sender', None)
+            display_name = self._extract_display_name(sender_field) if sender_field else None
+            is_automated_name = bool(display_name) and self._is_automated_name(display_name)
             
-            for contact_email in all_contacts:
-                if not contact_email or contact_email.lower() == user_email.lower():
+            # Check for professional headers
+            has_professional_headers = hasattr(message, 'raw_headers') and not self.PROFESSIONAL_INDICATORS.isdisjoint(
+                header.lower() for header in message.raw_headers
+            )
+            
+            # Extract contacts from sender and recipients
+            for contact_email in [sender_email] + recipients:
+                if not contact_email or contact_email.lower() == user_email_lower:
                     continue
                 
                 contact_email = contact_email.lower().strip()
@@ -327,11 +441,10 @@ class EmailContactFilteringService:
                 
                 # Update contact information
                 data['emails'].add(contact_email)
-                if hasattr(message, 'sender') and message.sender:
-                    # Extract display name from sender field
-                    display_name = self._extract_display_name(message.sender)
-                    if display_name:
-                        data['display_names'].add(display_name)
+                if display_name and not data['display_name']:
+                    data['display_name'] = display_name
+                if is_automated_name:
+                    data['has_automated_name'] = True
                 
                 # Update timestamps
                 if not data['first_seen'] or message_date < data['first_seen']:
@@ -340,53 +453,47 @@ class EmailContactFilteringService:
                     data['last_seen'] = message_date
                 
                 # Track sender/recipient roles
-                if contact_email == message.sender_email:
+                if contact_email == sender_email:
                     data['messages_as_sender'] += 1
                 else:
                     data['messages_as_recipient'] += 1
                 
                 # Track threads and labels
                 data['threads'].add(thread_id)
-                data['labels'].update(labels)
+                data['labels'] |= label_bits
                 
                 # Track communication patterns
-                data['communication_hours'].append(message_date.hour)
+                data['communication_hours'].append(message_hour)
                 
-                # Check for professional headers
-                if hasattr(message, 'raw_headers'):
-                    for header in self.PROFESSIONAL_INDICATORS:
-                        if header.lower() in [h.lower() for h in message.raw_headers.keys()]:
-                            data['has_professional_headers'] = True
-                            break
+                if has_professional_headers:
+                    data['has_professional_headers'] = True
         
         # Analyze thread patterns for response rates and depths
         for thread_id, thread_messages in threads.items():
-            thread_messages.sort(key=lambda x: x['date'])
+            thread_messages.sort(key=itemgetter('date'))
             thread_depth = len(thread_messages)
             
-            # Calculate response patterns
-            for i, msg in enumerate(thread_messages[:-1]):
-                next_msg = thread_messages[i + 1]
-                
+            # Calculate response patterns, resolving each sender's row once
+            rows = [contact_data.get(msg['sender']) for msg in thread_messages]
+            for (msg, next_msg), (row, next_row) in zip(pairwise(thread_messages), pairwise(rows)):
                 # Check if this is a response (different sender)
                 if msg['sender'] != next_msg['sender']:
                     response_time = (next_msg['date'] - msg['date']).total_seconds() / 3600
                     
                     # Add response time to both contacts
-                    if msg['sender'] in contact_data:
-                        contact_data[msg['sender']]['response_times'].append(response_time)
-                    if next_msg['sender'] in contact_data:
-                        contact_data[next_msg['sender']]['response_times'].append(response_time)
+                    if row is not None:
+                        row['response_times'].append(response_time)
+                    if next_row is not None:
+                        next_row['response_times'].append(response_time)
             
             # Add thread depth to all participants
-            participants = set()
-            for msg in thread_messages:
-                participants.add(msg['sender'])
-                participants.update(msg['recipients'])
+            participants = {msg['sender'] for msg in thread_messages}
+            participants.update(chain.from_iterable(msg['recipients'] for msg in thread_messages))
             
             for participant in participants:
-                if participant in contact_data:
-                    contact_data[participant]['thread_depths'].append(thread_depth)
+                row = contact_data.get(participant)
+                if row is not None:
+                    row['thread_depths'].append(thread_depth)
         
         # Convert to EmailContactMetadata objects
         contacts = {}
@@ -408,15 +515,15 @@ class EmailContactFilteringService:
             if data['response_times']:
                 avg_response_time = sum(data['response_times']) / len(data['response_times'])
             
-            # Determine if automated
-            is_automated = self._is_automated_sender(email, data['display_names'])
+            # Determine if automated; every display name seen was checked above
+            is_automated = data['has_automated_name'] or self._is_automated_email(email)
             
             # Determine if corporate domain
             is_corporate = self._is_corporate_domain(domain)
             
             contacts[email] = EmailContactMetadata(
                 email=email,
-                display_name=list(data['display_names'])[0] if data['display_names'] else '',
+                display_name=data['display_name'],
                 domain=domain,
                 first_seen=data['first_seen'],
                 last_seen=data['last_seen'],
@@ -442,7 +549,7 @@ class EmailContactFilteringService:
             return None
         
         # Handle formats like "John Doe <john@example.com>" or "john@example.com"
-        match = re.match(r'^([^<]+)<[^>]+>$', sender_field.strip())
+        match = self._DISPLAY_NAME_RE.match(sender_field.strip())
         if match:
             return match.group(1).strip().strip('"\'')
         
@@ -452,23 +559,17 @@ class EmailContactFilteringService:
         
         return sender_field.strip().strip('"\'')
     
-    def _is_automated_sender(self, email: str, display_names: Set[str]) -> bool:
+    def _is_automated_sender(self, email: str, display_names: Iterable[str]) -> bool:
         """Determine if sender appears to be automated"""
-        email_lower = email.lower()
-        
-        # Check email patterns
-        for pattern in self.AUTOMATION_PATTERNS:
-            if pattern in email_lower:
-                return True
-        
-        # Check display names
-        for name in display_names:
-            name_lower = name.lower()
-            for pattern in self.AUTOMATION_PATTERNS:
-                if pattern in name_lower:
-                    return True
-        
-        return False
+        return self._is_automated_email(email) or any(self._is_automated_name(name) for name in display_names)
+    
+    def _is_automated_email(self, email: str) -> bool:
+        """Determine if an email address matches an automation pattern"""
+        return self._AUTOMATION_RE.search(email.lower()) is not None
+    
+    def _is_automated_name(self, display_name: str) -> bool:
+        """Determine if a display name matches an automation pattern"""
+        return self._AUTOMATION_RE.search(display_name.lower()) is not None
     
     def _is_corporate_domain(self, domain: str) -> bool:
         """Determine if domain appears to be corporate"""
@@ -482,13 +583,9 @@ class EmailContactFilteringService:
             return False
         
         # Check if it has corporate TLD
-        for tld in self.CORPORATE_DOMAINS:
-            if domain_lower.endswith(tld):
-                return True
-        
-        return False
+        return domain_lower.endswith(self._CORPORATE_TLDS)
     
-    async def _filter_contacts(
+    def _filter_contacts(
         self,
         contact_metadata: Dict[str, EmailContactMetadata],
         min_message_count: int,
@@ -505,30 +602,18 @@ class EmailContactFilteringService:
         Returns:
             Filtered list of contact metadata
         """
-        filtered = []
-        
-        for contact in contact_metadata.values():
-            # Skip if below message threshold
-            if contact.message_count < min_message_count:
-                continue
-            
-            # Skip automated senders
-            if contact.is_automated:
-                continue
-            
+        return [
+            contact for contact in contact_metadata.values()
+            # Skip contacts below the message threshold and automated senders
+            if contact.message_count >= min_message_count
+            and not contact.is_automated
             # Skip spam
-            if 'SPAM' in contact.labels_seen or 'TRASH' in contact.labels_seen:
-                continue
-            
+            and not contact.labels_seen & self.EXCLUDED_LABEL_MASK
             # Check two-way requirement
-            if require_two_way and not (contact.is_sender and contact.is_recipient):
-                continue
-            
-            filtered.append(contact)
-        
-        return filtered
+            and (not require_two_way or (contact.is_sender and contact.is_recipient))
+        ]
     
-    async def _validate_two_way_communication(
+    def _validate_two_way_communication(
         self,
         contacts: List[EmailContactMetadata]
     ) -> List[TwoWayValidationResult]:
@@ -542,41 +627,42 @@ class EmailContactFilteringService:
             List of two-way validation results
         """
         results = []
+        now = datetime.now(timezone.utc)
         
         for contact in contacts:
             # Calculate relationship strength based on multiple factors
-            strength_factors = []
+            strength = 0.0
             
             # Bidirectional communication
             has_bidirectional = contact.is_sender and contact.is_recipient
             if has_bidirectional:
-                strength_factors.append(0.3)
+                strength += 0.3
             
             # Response rate
             if contact.response_rate > 0.5:
-                strength_factors.append(0.2)
+                strength += 0.2
             elif contact.response_rate > 0.2:
-                strength_factors.append(0.1)
+                strength += 0.1
             
             # Recent communication (within 30 days)
-            days_since_last = (datetime.now(timezone.utc) - contact.last_seen).days
+            days_since_last = (now - contact.last_seen).days
             if days_since_last <= 30:
-                strength_factors.append(0.2)
+                strength += 0.2
             elif days_since_last <= 90:
-                strength_factors.append(0.1)
+                strength += 0.1
             
             # Multiple threads
             if contact.thread_count > 3:
-                strength_factors.append(0.3)
+                strength += 0.3
             elif contact.thread_count > 1:
-                strength_factors.append(0.1)
+                strength += 0.1
             
             # Professional indicators
             if contact.has_professional_signature:
-                strength_factors.append(0.1)
+                strength += 0.1
             
             if contact.is_corporate_domain:
-                strength_factors.append(0.1)
+                strength += 0.1
             
             # Calculate average thread depth
             avg_thread_depth = (
@@ -585,7 +671,7 @@ class EmailContactFilteringService:
             )
             
             # Calculate overall relationship strength
-            relationship_strength = min(sum(strength_factors), 1.0)
+            relationship_strength = min(strength, 1.0)
             
             result = TwoWayValidationResult(
                 has_bidirectional=has_bidirectional,
@@ -602,7 +688,7 @@ class EmailContactFilteringService:
         
         return results
     
-    async def _score_contacts(
+    def _score_contacts(
         self,
         validation_results: List[TwoWayValidationResult]
     ) -> List[Dict[str, Any]]:
@@ -619,6 +705,7 @@ class EmailContactFilteringService:
         
         # Use existing contact scoring weights
         weights = ScoringWeights()
+        now = datetime.now(timezone.utc)
         
         for i, result in enumerate(validation_results):
             # Create contact data for scoring
@@ -633,20 +720,11 @@ class EmailContactFilteringService:
             }
             
             # Calculate quality score
-            quality_score = self._calculate_quality_score(result, weights)
+            quality_score = self._calculate_quality_score(result, weights, now)
             contact_data['quality_score'] = quality_score
             
             # Determine contact tier based on score
-            if quality_score >= 0.8:
-                contact_data['tier'] = 'tier_1_key'
-            elif quality_score >= 0.6:
-                contact_data['tier'] = 'tier_2_important'
-            elif quality_score >= 0.4:
-                contact_data['tier'] = 'tier_3_regular'
-            elif quality_score >= 0.2:
-                contact_data['tier'] = 'tier_4_occasional'
-            else:
-                contact_data['tier'] = 'tier_5_minimal'
+            contact_data['tier'] = self.QUALITY_TIERS[bisect_right(self.QUALITY_TIER_THRESHOLDS, quality_score)]
             
             scored_contacts.append(contact_data)
         
@@ -655,9 +733,13 @@ class EmailContactFilteringService:
     def _calculate_quality_score(
         self,
         result: TwoWayValidationResult,
-        weights: ScoringWeights
+        weights: ScoringWeights,
+        now: Optional[datetime] = None
     ) -> float:
-        """Calculate contact quality score"""
+        """Calculate contact quality score relative to now (defaults to the current time)"""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
         score = 0.0
         
         # Two-way communication
@@ -668,7 +750,7 @@ class EmailContactFilteringService:
         score += result.response_rate * 0.2
         
         # Recent activity
-        days_since = (datetime.now(timezone.utc) - result.last_exchange).days
+        days_since = (now - result.last_exchange).days
         if days_since <= 30:
             score += 0.2
         elif days_since <= 90:
@@ -693,22 +775,35 @@ class EmailContactFilteringService:
         validated_contacts: List[TwoWayValidationResult]
     ) -> Dict[str, Any]:
         """Generate filtering statistics"""
+        automated_count = 0
+        spam_count = 0
+        for contact in all_contacts.values():
+            if contact.is_automated:
+                automated_count += 1
+            if contact.labels_seen & self.LABEL_BITS['SPAM']:
+                spam_count += 1
+        
+        corporate_count = 0
+        message_total = 0
+        thread_total = 0
+        for contact in filtered_contacts:
+            if contact.is_corporate_domain:
+                corporate_count += 1
+            message_total += contact.message_count
+            thread_total += contact.thread_count
+        
+        filtered_count = len(filtered_contacts)
+        
         return {
             'total_contacts_found': len(all_contacts),
-            'contacts_after_filtering': len(filtered_contacts),
+            'contacts_after_filtering': filtered_count,
             'contacts_with_two_way': len(validated_contacts),
-            'automated_contacts_filtered': len([c for c in all_contacts.values() if c.is_automated]),
-            'spam_contacts_filtered': len([c for c in all_contacts.values() if 'SPAM' in c.labels_seen]),
-            'corporate_domains': len([c for c in filtered_contacts if c.is_corporate_domain]),
-            'personal_domains': len([c for c in filtered_contacts if not c.is_corporate_domain]),
-            'avg_messages_per_contact': (
-                sum(c.message_count for c in filtered_contacts) / len(filtered_contacts)
-                if filtered_contacts else 0
-            ),
-            'avg_threads_per_contact': (
-                sum(c.thread_count for c in filtered_contacts) / len(filtered_contacts)
-                if filtered_contacts else 0
-            ),
+            'automated_contacts_filtered': automated_count,
+            'spam_contacts_filtered': spam_count,
+            'corporate_domains': corporate_count,
+            'personal_domains': filtered_count - corporate_count,
+            'avg_messages_per_contact': message_total / filtered_count if filtered_count else 0,
+            'avg_threads_per_contact': thread_total / filtered_count if filtered_count else 0,
             'avg_relationship_strength': (
                 sum(r.relationship_strength for r in validated_contacts) / len(validated_contacts)
                 if validated_contacts else 0
@@ -779,9 +874,27 @@ class EmailContactFilteringService:
             Filtering statistics
         """
         try:
-            # This would typically query stored filtering results
-            # For now, return placeholder statistics
+            # Report the most recent cached filtering run when there is one
+            cached = latest_filtering_runs.get(integration_id)
+            if cached is not None:
+                result = cached['result']
+                return {
+                    'last_filtering_run': cached['completed_at'].isoformat(),
+                    'total_emails_analyzed': cached['messages_analyzed'],
+                    'contacts_extracted': result.contacts_extracted,
+                    'contacts_filtered': result.contacts_filtered,
+                    'two_way_validated': result.two_way_validated,
+                    'professional_contacts': result.professional_contacts,
+                    'automated_filtered': result.automated_filtered,
+                    'spam_filtered': result.spam_filtered,
+                    'avg_quality_score': (
+                        sum(c['quality_score'] for c in result.contacts) / len(result.contacts)
+                        if result.contacts else 0.0
+                    ),
+                    'top_domains': [dict(domain) for domain in cached['top_domains']]
+                }
             
+            # Otherwise return placeholder statistics
             return {
                 'last_filtering_run': datetime.now(timezone.utc).isoformat(),
                 'total_emails_analyzed': 1500,
@@ -832,7 +945,7 @@ class EmailContactFilteringService:
             )
             
             # Analyze contact metadata
-            contact_metadata = await self._extract_contact_metadata(
+            contact_metadata = self._extract_contact_metadata(
                 sync_result.messages, integration.metadata.get('email_address', '')
             )
             
@@ -846,7 +959,7 @@ class EmailContactFilteringService:
             contact = contact_metadata[contact_email]
             
             # Perform validation
-            validation = await self._validate_two_way_communication([contact])
+            validation = self._validate_two_way_communication([contact])
             
             return {
                 'email': contact_email,
@@ -17,6 +17,7 @@ from models.orm.integration import Integration
 from models.orm.user import User
 from services.integration_service import IntegrationService
 from services.integration_status_service import IntegrationStatusService
+from services.conversation_threading_service import ConversationThreadingService
 from lib.database import get_db
 from services.oauth_service import OAuthService
 from lib.oauth_client import OAuthProvider
@@ -243,6 +244,10 @@ class GmailIntegrationService:
                 }
             )
             
+            # New messages change the user's threads, so rebuild their summaries in the background
+            if sync_result.messages_processed:
+                await ConversationThreadingService.schedule_summary_refresh_async(str(integration.user_id))
+            
             return sync_result
             
         except Exception as e:
@@ -302,7 +302,7 @@ async def test_conversation_threading():
         )
         
         # Find merge candidates
-        merge_candidates = await service._find_thread_merge_candidates(all_threads)
+        merge_candidates = service._find_thread_merge_candidates(all_threads)
         
         print(f"✅ Found {len(merge_candidates)} merge candidates")
         
@@ -0,0 +1,96 @@
+"""Tests for ContactScoringService."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from services.contact_scoring import ContactScoringService
+
+
+@pytest.fixture
+def scoring_service():
+    """ContactScoringService instance."""
+    return ContactScoringService()
+
+
+def make_contact(contact_id, interactions):
+    """Batch item for one contact."""
+    return {
+        "contact_data": {"id": contact_id, "company": "Acme Inc", "job_title": "CTO"},
+        "interactions": interactions
+    }
+
+
+def make_interaction(days_ago, content="Great meeting, thanks! What are your thoughts on the plan?"):
+    """Interaction dictionary as passed to the scoring service."""
+    return {
+        "interaction_type": "email",
+        "direction": "inbound",
+        "interaction_date": datetime.now(timezone.utc) - timedelta(days=days_ago),
+        "content": content
+    }
+
+
+def without_timestamp(result):
+    """Scoring result without its last_updated timestamp."""
+    return {key: value for key, value in result.items() if key != "last_updated"}
+
+
+class TestScoreContactsBatch:
+    """Test cases for ContactScoringService.score_contacts_batch."""
+
+    @pytest.mark.asyncio
+    async def test_malformed_contact_is_skipped(self, scoring_service):
+        """Test one malformed contact does not abort scoring of the rest of the batch."""
+        first = make_contact("1", [make_interaction(2), make_interaction(10)])
+        malformed = make_contact("2", [make_interaction(3), make_interaction(4, content=42)])
+        last = make_contact("3", [make_interaction(1, content="Sorry about the issue")])
+
+        results = await scoring_service.score_contacts_batch([first, malformed, last])
+
+        assert [result["contact_id"] for result in results] == ["1", "3"]
+
+        # The skipped contact must not shift the content features of later contacts
+        expected = await scoring_service.score_contacts_batch([first, last])
+        assert [without_timestamp(result) for result in results] == [
+            without_timestamp(result) for result in expected
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_interactions_is_skipped(self, scoring_service):
+        """Test a contact without an interactions list is skipped."""
+        results = await scoring_service.score_contacts_batch([
+            {"contact_data": {"id": "1"}},
+            make_contact("2", [make_interaction(5)])
+        ])
+
+        assert [result["contact_id"] for result in results] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_scores_are_rounded(self, scoring_service):
+        """Test the service returns scores and metrics at their documented precision."""
+        interactions = [make_interaction(days_ago) for days_ago in (1, 4, 9, 16, 33, 61)]
+
+        result = (await scoring_service.score_contacts_batch([make_contact("1", interactions)]))[0]
+
+        assert result["overall_score"] == round(result["overall_score"], 3)
+        assert result["confidence_level"] == round(result["confidence_level"], 3)
+        for score in result["component_scores"].values():
+            assert score == round(score, 3)
+
+        metrics = result["metrics"]
+        assert metrics["interaction_frequency_per_month"] == round(metrics["interaction_frequency_per_month"], 2)
+        assert metrics["response_rate"] == round(metrics["response_rate"], 3)
+
+
+class TestDefaultWeights:
+    """Test cases for ContactScoringService.get_default_weights."""
+
+    def test_mutating_result_keeps_defaults(self, scoring_service):
+        """Test changing the returned weights does not change later results."""
+        weights = scoring_service.get_default_weights()
+        original = dict(weights)
+
+        for name in weights:
+            weights[name] = 0.0
+
+        assert scoring_service.get_default_weights() == original
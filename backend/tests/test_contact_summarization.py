@@ -0,0 +1,92 @@
+"""Tests for ContactSummarizationService."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from services.contact_summarization import ContactSummarizationService
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def summarization_service(mock_db):
+    """ContactSummarizationService instance with mocked AI clients and no Redis."""
+    with patch('services.contact_summarization.AIAssistantService'), \
+         patch('services.contact_summarization.ConversationThreadingService'), \
+         patch('services.contact_summarization.get_openai_client'), \
+         patch('services.contact_summarization.get_redis_client', side_effect=ConnectionError):
+        return ContactSummarizationService(mock_db)
+
+
+def make_interaction():
+    """Interaction loaded with the prompt columns only; reading contact_id would lazy-load it."""
+    return Mock(spec=['id', 'interaction_type', 'interaction_date', 'content_summary', 'subject'])
+
+
+class TestFetchRecentInteractionsBatch:
+    """Test cases for ContactSummarizationService._fetch_recent_interactions_batch."""
+
+    def test_multi_contact_batch_runs_one_query(self, summarization_service, mock_db):
+        """Test interactions of many contacts are fetched and grouped without per-row loads."""
+        contact_ids = [str(uuid4()) for _ in range(3)]
+        rows = [
+            (make_interaction(), contact_id)
+            for contact_id in contact_ids
+            for _ in range(4)
+        ]
+
+        query = mock_db.query.return_value
+        ranked = query.filter.return_value.subquery.return_value
+        ranked.c.recency_rank.__le__.return_value = True
+        query.join.return_value.filter.return_value.options.return_value \
+            .order_by.return_value.all.return_value = rows
+
+        grouped = summarization_service._fetch_recent_interactions_batch(contact_ids, uuid4(), limit=4)
+
+        # One call builds the ranking subquery, one builds the statement that is executed
+        assert mock_db.query.call_count == 2
+        query.filter.return_value.subquery.assert_called_once()
+        query.join.return_value.filter.return_value.options.return_value \
+            .order_by.return_value.all.assert_called_once()
+        assert list(grouped) == contact_ids
+        assert all(len(interactions) == 4 for interactions in grouped.values())
+        assert grouped[contact_ids[0]] == [interaction for interaction, _ in rows[:4]]
+
+    def test_no_contacts_skips_query(self, summarization_service, mock_db):
+        """Test an empty batch does not touch the database."""
+        assert summarization_service._fetch_recent_interactions_batch([], uuid4()) == {}
+        mock_db.query.assert_not_called()
+
+
+class TestSummaryCache:
+    """Test cases for the process-wide summary cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_summary_is_isolated(self, summarization_service):
+        """Test nested changes to a cached summary do not leak into later reads or the caller's copy."""
+        contact_id, user_id = uuid4(), uuid4()
+        summary = {
+            "summary": "Met at the conference",
+            "key_topics": ["hiring"],
+            "generated_at": datetime.utcnow().isoformat()
+        }
+        summarization_service.local_cache.clear()
+
+        await summarization_service._cache_summary(contact_id, user_id, "brief", summary)
+        summary["key_topics"].append("caller edit")
+
+        first = await summarization_service._get_cached_summary(contact_id, user_id, "brief")
+        first["key_topics"].append("reader edit")
+        second = await summarization_service._get_cached_summary(contact_id, user_id, "brief")
+
+        assert second["key_topics"] == ["hiring"]
+        assert second["cached"] is True
+        summarization_service.local_cache.clear()
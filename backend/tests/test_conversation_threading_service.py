@@ -0,0 +1,322 @@
+"""Tests for ConversationThreadingService."""
+
+import pytest
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from functools import reduce
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy.orm import Session
+
+from services.conversation_threading_service import (
+    ConversationThread,
+    ConversationThreadingService,
+    ThreadMergeCandidate,
+    thread_summary_cache
+)
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return Mock(spec=Session)
+
+
+@pytest.fixture
+def threading_service(mock_db):
+    """ConversationThreadingService instance with mocked AI assistant and no Redis."""
+    thread_summary_cache.clear()
+    with patch('services.conversation_threading_service.AIAssistantService'), \
+         patch('services.conversation_threading_service.get_redis_client', side_effect=ConnectionError):
+        service = ConversationThreadingService(mock_db)
+    service.ai_assistant.generate_with_cache = AsyncMock()
+    yield service
+    thread_summary_cache.clear()
+
+
+def make_thread(
+    thread_id,
+    start,
+    interaction_count=3,
+    platform='email',
+    thread_type='ongoing',
+    themes=('budget review',),
+    context_score=0.5,
+    thread_depth=1,
+    participant_count=2
+):
+    """Thread of one contact with interactions a day apart from start."""
+    interactions = [
+        {
+            'id': f"{thread_id}-{index}",
+            'interaction_date': (start + timedelta(days=index)).isoformat(),
+            'interaction_type': platform,
+            'subject': themes[0] if themes else None
+        }
+        for index in range(interaction_count)
+    ]
+    return ConversationThread(
+        thread_id=thread_id,
+        contact_id='contact-1',
+        user_id='user-1',
+        platforms={platform},
+        interactions=interactions,
+        start_date=start,
+        end_date=start + timedelta(days=interaction_count - 1),
+        total_interactions=interaction_count,
+        thread_depth=thread_depth,
+        subject_themes=list(themes),
+        dominant_platform=platform,
+        participant_count=participant_count,
+        thread_type=thread_type,
+        context_score=context_score
+    )
+
+
+def make_candidate(thread_a, thread_b, recommended_action='auto_merge', confidence=0.9):
+    """Merge candidate for two threads."""
+    return ThreadMergeCandidate(
+        thread_a=thread_a,
+        thread_b=thread_b,
+        merge_confidence=confidence,
+        merge_strategy='temporal_overlap',
+        evidence={},
+        recommended_action=recommended_action
+    )
+
+
+def thread_fields(thread):
+    """Thread fields for comparison, with subject themes as a set."""
+    fields = asdict(thread)
+    fields['subject_themes'] = set(fields['subject_themes'])
+    fields.pop('_theme_set', None)
+    return fields
+
+
+def llm_response(content):
+    """LLM response carrying the given content."""
+    return Mock(content=content)
+
+
+class TestSubjectSimilarity:
+    """Test cases for subject similarity scoring."""
+
+    def test_similarity_is_difflib_ratio(self, threading_service):
+        """Test similarity is difflib's ratio of the normalized subjects."""
+        similarity = threading_service._calculate_subject_similarity('final hiring q3', 'final review q3')
+
+        assert similarity == SequenceMatcher(None, 'final hiring q3', 'final review q3').ratio()
+        assert similarity == pytest.approx(0.667, abs=1e-3)
+
+    def test_reply_prefixes_are_ignored(self, threading_service):
+        """Test reply and forward prefixes do not affect similarity."""
+        assert threading_service._calculate_subject_similarity('Re: Project update', 'Fwd: project update') == 1.0
+        assert threading_service._subjects_similar('Re: Project update', 'Fwd: project update')
+
+    @pytest.mark.parametrize("subject1,subject2", [
+        ('final hiring q3', 'final review q3'),
+        ('Budget review', 'Team offsite'),
+        ('Quarterly planning', 'Quarterly planning notes'),
+        ('Intro call', 'Intro call follow-up'),
+        ('', 'Lunch')
+    ])
+    def test_subjects_similar_matches_threshold(self, threading_service, subject1, subject2):
+        """Test the pre-filtered check agrees with comparing the full ratio to the threshold."""
+        expected = (
+            threading_service._calculate_subject_similarity(subject1, subject2) >=
+            threading_service.SUBJECT_SIMILARITY_THRESHOLD
+        )
+
+        assert threading_service._subjects_similar(subject1, subject2) is expected
+
+
+class TestThreadMerging:
+    """Test cases for merging threads."""
+
+    def test_chain_of_candidates_merges_into_one_thread(self, threading_service):
+        """Test candidates A-B and B-C merge A, B and C into a single thread."""
+        start = datetime(2024, 1, 1)
+        thread_a = make_thread('a', start)
+        thread_b = make_thread('b', start + timedelta(days=10))
+        thread_c = make_thread('c', start + timedelta(days=20))
+
+        merged = threading_service._process_thread_merges(
+            [thread_a, thread_b, thread_c],
+            [make_candidate(thread_a, thread_b), make_candidate(thread_b, thread_c)]
+        )
+
+        assert len(merged) == 1
+        assert merged[0].thread_id == 'a_merged_b_merged_c'
+        assert merged[0].total_interactions == 9
+        assert [interaction['id'] for interaction in merged[0].interactions] == [
+            f"{thread_id}-{index}" for thread_id in 'abc' for index in range(3)
+        ]
+
+    def test_candidates_below_auto_merge_stay_separate(self, threading_service):
+        """Test only auto-merge candidates are merged."""
+        start = datetime(2024, 1, 1)
+        thread_a = make_thread('a', start)
+        thread_b = make_thread('b', start + timedelta(days=10))
+        thread_c = make_thread('c', start + timedelta(days=20))
+
+        merged = threading_service._process_thread_merges(
+            [thread_a, thread_b, thread_c],
+            [make_candidate(thread_a, thread_b), make_candidate(thread_b, thread_c, 'manual_review', 0.7)]
+        )
+
+        assert sorted(thread.thread_id for thread in merged) == ['a_merged_b', 'c']
+
+    @pytest.mark.parametrize("threads", [
+        [
+            make_thread('a', datetime(2024, 1, 1), 3, 'meeting', 'dormant', ('kickoff',), 0.2),
+            make_thread('b', datetime(2024, 1, 2), 5, 'email', 'completed', ('budget review',), 0.9),
+            make_thread('c', datetime(2024, 1, 3), 2, 'linkedin', 'ongoing', ('kickoff', 'hiring'), 0.4)
+        ],
+        [
+            # Equal platform priority and size, so ties decide the dominant platform
+            make_thread('a', datetime(2024, 1, 1), 4, 'meeting', 'sporadic', ('offsite',), 0.6, 3),
+            make_thread('b', datetime(2024, 1, 1), 4, 'calendar', 'sporadic', ('offsite',), 0.1, 1, 5),
+            make_thread('c', datetime(2024, 1, 5), 4, 'meeting', 'dormant', ('q3',), 0.3),
+            make_thread('d', datetime(2024, 1, 9), 1, 'manual', 'ongoing', (), 1.0)
+        ]
+    ])
+    def test_merge_thread_group_matches_pairwise_fold(self, threading_service, threads):
+        """Test merging a group gives the same thread as folding pairwise merges from the left."""
+        expected = reduce(threading_service._merge_threads, threads)
+
+        merged = threading_service._merge_thread_group(threads)
+
+        assert thread_fields(merged) == thread_fields(expected)
+
+
+class TestBatchSummaries:
+    """Test cases for batched thread summaries."""
+
+    @pytest.mark.asyncio
+    async def test_missing_and_out_of_range_sections_are_ignored(self, threading_service):
+        """Test sections absent from or outside the batch leave their threads unsummarized."""
+        threads = [
+            make_thread(thread_id, datetime(2024, 1, 1), themes=(theme,))
+            for thread_id, theme in (('a', 'budget review'), ('b', 'hiring plan'), ('c', 'offsite'))
+        ]
+        threading_service.ai_assistant.generate_with_cache.return_value = llm_response(
+            "### 1: The budget review is on track and numbers were shared by email.\n"
+            "### 0: Section zero does not exist, so it is ignored despite the hiring plan.\n"
+            "### 4: Section four does not exist either, even though it mentions the offsite.\n"
+            "### 3: The offsite agenda was agreed and the venue confirmed over email."
+        )
+
+        summaries = await threading_service._batch_summarize(threads)
+
+        assert summaries == [
+            "The budget review is on track and numbers were shared by email.",
+            None,
+            "The offsite agenda was agreed and the venue confirmed over email."
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_sections_fall_back_to_single_requests(self, threading_service):
+        """Test threads missing from the batched response get a request of their own."""
+        threads = [
+            make_thread(thread_id, datetime(2024, 1, 1), themes=(theme,))
+            for thread_id, theme in (('a', 'budget review'), ('b', 'hiring plan'))
+        ]
+        threading_service.ai_assistant.generate_with_cache.side_effect = [
+            llm_response("### 1: The budget review is on track and numbers were shared by email."),
+            llm_response("The hiring plan was approved and two roles open next month.")
+        ]
+
+        summaries = await threading_service.generate_thread_summaries_batch(threads)
+
+        assert summaries == [
+            "The budget review is on track and numbers were shared by email.",
+            "The hiring plan was approved and two roles open next month."
+        ]
+        assert threading_service.ai_assistant.generate_with_cache.await_count == 2
+
+
+class TestSummaryEscalation:
+    """Test cases for escalating thread summaries to the stronger model."""
+
+    @pytest.mark.asyncio
+    async def test_acceptable_summary_is_not_escalated(self, threading_service):
+        """Test a summary passing the quality gate is kept from the default model."""
+        thread = make_thread('a', datetime(2024, 1, 1))
+        threading_service.ai_assistant.generate_with_cache.return_value = llm_response(
+            "The budget review covered the Q3 numbers and next steps by email."
+        )
+
+        summary = await threading_service.generate_thread_summary(thread)
+
+        assert summary == "The budget review covered the Q3 numbers and next steps by email."
+        generate = threading_service.ai_assistant.generate_with_cache
+        assert generate.await_count == 1
+        assert generate.await_args.kwargs['model'] == ConversationThreadingService.SUMMARY_MODEL
+
+    @pytest.mark.asyncio
+    async def test_unacceptable_summary_is_escalated(self, threading_service):
+        """Test a summary failing the quality gate is regenerated with the escalation model."""
+        thread = make_thread('a', datetime(2024, 1, 1))
+        threading_service.ai_assistant.generate_with_cache.side_effect = [
+            llm_response("Too short."),
+            llm_response("The budget review covered the Q3 numbers and next steps by email.")
+        ]
+
+        summary = await threading_service.generate_thread_summary(thread)
+
+        assert summary == "The budget review covered the Q3 numbers and next steps by email."
+        models = [
+            call.kwargs['model']
+            for call in threading_service.ai_assistant.generate_with_cache.await_args_list
+        ]
+        assert models == [
+            ConversationThreadingService.SUMMARY_MODEL,
+            ConversationThreadingService.SUMMARY_ESCALATION_MODEL
+        ]
+
+    @pytest.mark.asyncio
+    async def test_trivial_thread_skips_llm(self, threading_service):
+        """Test threads below SUMMARY_MIN_INTERACTIONS get the fallback summary without a request."""
+        thread = make_thread('a', datetime(2024, 1, 1), interaction_count=2)
+
+        summary = await threading_service.generate_thread_summary(thread)
+
+        assert summary == threading_service._fallback_summary(thread)
+        threading_service.ai_assistant.generate_with_cache.assert_not_called()
+
+
+class TestSummaryCache:
+    """Test cases for the Redis copy of thread summaries."""
+
+    @pytest.mark.asyncio
+    async def test_summary_cached_in_redis_is_reused(self, threading_service):
+        """Test a summary from Redis is reused while the thread has grown by one interaction."""
+        thread = make_thread('a', datetime(2024, 1, 1))
+        threading_service._summary_redis = Mock()
+        threading_service._summary_redis.get.return_value = (
+            '{"fingerprint": "stale", "interaction_count": 2, '
+            '"summary": "The budget review covered the Q3 numbers by email."}'
+        )
+
+        summary = await threading_service.generate_thread_summary(thread)
+
+        assert summary == "The budget review covered the Q3 numbers by email."
+        threading_service.ai_assistant.generate_with_cache.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generated_summary_is_written_to_redis(self, threading_service):
+        """Test a newly generated summary is stored in Redis for other processes."""
+        thread = make_thread('a', datetime(2024, 1, 1))
+        threading_service._summary_redis = Mock()
+        threading_service._summary_redis.get.return_value = None
+        threading_service.ai_assistant.generate_with_cache.return_value = llm_response(
+            "The budget review covered the Q3 numbers and next steps by email."
+        )
+
+        await threading_service.generate_thread_summary(thread)
+
+        threading_service._summary_redis.setex.assert_called_once()
+        key, ttl, _ = threading_service._summary_redis.setex.call_args.args
+        assert key == 'thread_summary:user-1:contact-1:a-0'
+        assert ttl == ConversationThreadingService.SUMMARY_CACHE_TTL_SECONDS
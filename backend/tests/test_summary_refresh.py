@@ -0,0 +1,169 @@
+"""Tests for background thread summary refresh scheduling."""
+
+import pytest
+import threading
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from services.conversation_threading_service import (
+    ConversationThreadingService,
+    pending_summary_refreshes
+)
+from services.contact_merging import ContactMergingService
+from services.contact_summarization import ContactSummarizationService
+from models.orm.contact import Contact
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return Mock(spec=Session)
+
+
+@pytest.fixture
+def mock_celery():
+    """Celery app that records queued tasks, with Redis unavailable."""
+    pending_summary_refreshes.clear()
+    with patch('workers.celery_app.celery_app') as celery_app, \
+         patch('services.conversation_threading_service.get_redis_client', side_effect=ConnectionError):
+        yield celery_app
+    pending_summary_refreshes.clear()
+
+
+@pytest.fixture
+def sample_contact():
+    """Sample contact for testing."""
+    contact = Mock(spec=Contact)
+    contact.id = uuid4()
+    contact.user_id = uuid4()
+    return contact
+
+
+class TestScheduleSummaryRefresh:
+    """Test cases for ConversationThreadingService.schedule_summary_refresh."""
+
+    def test_queues_delayed_task(self, mock_celery):
+        """Test a refresh is queued once the delay window has passed."""
+        assert ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1') is True
+
+        mock_celery.send_task.assert_called_once_with(
+            'workers.tasks.thread_summary_task',
+            kwargs={'user_id': 'user-1', 'contact_id': 'contact-1'},
+            countdown=ConversationThreadingService.SUMMARY_REFRESH_DELAY_SECONDS
+        )
+
+    def test_burst_queues_one_task(self, mock_celery):
+        """Test a burst of requests for one contact queues a single task."""
+        results = [
+            ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1')
+            for _ in range(5)
+        ]
+
+        assert results == [True, False, False, False, False]
+        assert mock_celery.send_task.call_count == 1
+
+    def test_contacts_are_deduplicated_separately(self, mock_celery):
+        """Test pending refreshes for one contact do not absorb another's."""
+        ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1')
+        ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-2')
+        ConversationThreadingService.schedule_summary_refresh('user-1')
+
+        assert mock_celery.send_task.call_count == 3
+
+    def test_pending_in_redis_skips_task(self, mock_celery):
+        """Test a refresh already pending in another process is not queued again."""
+        redis_client = Mock()
+        redis_client.set.return_value = None
+
+        with patch('services.conversation_threading_service.get_redis_client', return_value=redis_client):
+            assert ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1') is False
+
+        redis_client.set.assert_called_once_with(
+            'thread_summary_refresh:user-1:contact-1',
+            1,
+            nx=True,
+            ex=ConversationThreadingService.SUMMARY_REFRESH_DELAY_SECONDS
+        )
+        mock_celery.send_task.assert_not_called()
+
+    def test_failed_send_allows_retry(self, mock_celery):
+        """Test a refresh that could not be queued is retried on the next request."""
+        mock_celery.send_task.side_effect = [Exception("Broker down"), None]
+
+        assert ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1') is False
+        assert ConversationThreadingService.schedule_summary_refresh('user-1', 'contact-1') is True
+        assert mock_celery.send_task.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_variant_queues_from_worker_thread(self, mock_celery):
+        """Test the async variant keeps the Redis and broker calls off the event loop thread."""
+        publishing_threads = []
+        mock_celery.send_task.side_effect = lambda *args, **kwargs: publishing_threads.append(
+            threading.get_ident()
+        )
+
+        queued = await ConversationThreadingService.schedule_summary_refresh_async('user-1', 'contact-1')
+
+        assert queued is True
+        assert publishing_threads and publishing_threads[0] != threading.get_ident()
+
+
+class TestSummaryRefreshTriggers:
+    """Test that paths adding interactions to a contact queue a refresh."""
+
+    @pytest.mark.asyncio
+    async def test_new_interaction_queues_refresh(self, mock_db, mock_celery, sample_contact):
+        """Test a new interaction queues a refresh of the contact's thread summaries."""
+        with patch('services.contact_summarization.AIAssistantService'), \
+             patch('services.conversation_threading_service.AIAssistantService'), \
+             patch('services.contact_summarization.get_openai_client'), \
+             patch('services.contact_summarization.get_redis_client', side_effect=ConnectionError):
+            service = ContactSummarizationService(mock_db)
+
+        with patch.object(service, '_get_contact_with_validation', return_value=sample_contact):
+            result = await service.update_summary_on_interaction(
+                sample_contact.id, sample_contact.user_id, {"type": "email"}
+            )
+
+        assert result is True
+        mock_celery.send_task.assert_called_once_with(
+            'workers.tasks.thread_summary_task',
+            kwargs={'user_id': str(sample_contact.user_id), 'contact_id': str(sample_contact.id)},
+            countdown=ConversationThreadingService.SUMMARY_REFRESH_DELAY_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_merge_with_interactions_queues_refresh(self, mock_db, mock_celery, sample_contact):
+        """Test merging a contact's interactions queues a refresh for the primary contact."""
+        service = ContactMergingService(mock_db)
+        secondary_contact = Mock(spec=Contact)
+        secondary_contact.id = uuid4()
+
+        with patch.object(service, '_generate_merged_data', return_value={}), \
+             patch.object(service, '_merge_interactions', return_value=3), \
+             patch.object(service, '_merge_interests', return_value=0):
+            result = await service._execute_merge(sample_contact, secondary_contact, [])
+
+        assert result.interactions_merged == 3
+        mock_db.commit.assert_called_once()
+        mock_celery.send_task.assert_called_once_with(
+            'workers.tasks.thread_summary_task',
+            kwargs={'user_id': str(sample_contact.user_id), 'contact_id': str(sample_contact.id)},
+            countdown=ConversationThreadingService.SUMMARY_REFRESH_DELAY_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_merge_without_interactions_skips_refresh(self, mock_db, mock_celery, sample_contact):
+        """Test a merge that moves no interactions does not queue a refresh."""
+        service = ContactMergingService(mock_db)
+        secondary_contact = Mock(spec=Contact)
+        secondary_contact.id = uuid4()
+
+        with patch.object(service, '_generate_merged_data', return_value={}), \
+             patch.object(service, '_merge_interactions', return_value=0), \
+             patch.object(service, '_merge_interests', return_value=0):
+            await service._execute_merge(sample_contact, secondary_contact, [])
+
+        mock_celery.send_task.assert_not_called()
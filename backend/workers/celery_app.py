@@ -70,6 +70,7 @@ celery_app.conf.update(
         
         # AI Processing Tasks
         'workers.tasks.ai_analysis_task': {'queue': 'ai_tasks'},
+        'workers.tasks.thread_summary_task': {'queue': 'ai_tasks'},
         'workers.tasks.interest_extraction_task': {'queue': 'ai_tasks'},
         'workers.tasks.briefing_generation_task': {'queue': 'ai_tasks'},
         'workers.tasks.message_generation_task': {'queue': 'ai_tasks'},
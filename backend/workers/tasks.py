@@ -54,6 +54,11 @@ try:
 except ImportError:
     ContactRelationshipIntegrationService = None
 
+try:
+    from services.conversation_threading_service import ConversationThreadingService
+except ImportError:
+    ConversationThreadingService = None
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -560,6 +565,50 @@ def ai_analysis_task(self, user_id: str, content_type: str, content_ids: List[st
         raise self.retry(exc=e, countdown=300)
 
 
+@celery_app.task(bind=True, max_retries=2, default_retry_delay=300)
+def thread_summary_task(self, user_id: str, contact_id: str = None, days_back: int = 90):
+    """
+    Pre-generate conversation thread summaries so reads are served from cache
+    
+    Args:
+        user_id: User ID
+        contact_id: Optional contact whose threads changed (if None, all contacts)
+        days_back: Number of days of interactions to thread
+    """
+    try:
+        logger.info(f"Refreshing thread summaries for user {user_id}, contact {contact_id}")
+        
+        db = get_task_session()
+        
+        try:
+            service = ConversationThreadingService(db)
+            threads = asyncio.run(
+                service.build_conversation_threads(
+                    user_id=user_id,
+                    contact_id=contact_id,
+                    days_back=days_back,
+                    include_summaries=True
+                )
+            )
+            
+            return {
+                'user_id': user_id,
+                'contact_id': contact_id,
+                'threads_summarized': len(threads),
+                'completed_at': datetime.now(timezone.utc).isoformat()
+            }
+            
+        finally:
+            db.close()
+            
+    except Exception as e:
+        error_info = handle_task_error('thread_summary_task', e, {
+            'user_id': user_id,
+            'contact_id': contact_id
+        })
+        raise self.retry(exc=e, countdown=300)
+
+
 @celery_app.task(bind=True, max_retries=2, default_retry_delay=300)
 def interest_extraction_task(self, user_id: str, content_ids: List[str], content_type: str):
     """